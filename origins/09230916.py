@@ -1,26 +1,54 @@
 import sys
 import os
+import abc
 import requests
 from requests.exceptions import RequestException
 from bs4 import BeautifulSoup
 import time
 import urllib.parse
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QLabel, QMessageBox, QProgressBar, QTableWidget, QTableWidgetItem, QTabWidget, QFileDialog, QHeaderView)
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QLabel, QMessageBox, QProgressBar, QTableWidget, QTableWidgetItem, QTabWidget, QFileDialog, QHeaderView, QCheckBox, QComboBox)
+from PyQt5.QtGui import QPixmap, QImage
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
 from openpyxl import Workbook
 from openpyxl.drawing.image import Image
 from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+try:
+    from PIL import Image as PILImage  # 이미지 지각 해시(중복 사진 찾기)용, 없으면 그냥 다운로드만 함
+except ImportError:
+    PILImage = None
 from googletrans import Translator
 from gspread.exceptions import APIError
 from concurrent.futures import ThreadPoolExecutor
 import telebot
 from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
+from telebot.apihelper import ApiTelegramException
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import threading
 import re
 import datetime
+import sqlite3
+import unicodedata
+import json
+import hashlib
+import random
+import email.utils
+import contextlib
+import functools
+import http.server
+import queue
+import io
+import shutil
+import argparse
+import subprocess
+import socket
+import zipfile
+import atexit
+try:
+    import fcntl  # 번역 캐시 파일 잠금용 (Windows에는 없음)
+except ImportError:
+    fcntl = None
 
 # 브랜드 리스트 정의
 BRANDS = [
@@ -34,9 +62,438 @@ bot = telebot.TeleBot(BOT_TOKEN)
 # 구글 스프레드시트 설정
 SPREADSHEET_CREDENTIALS = '/Users/hwangseungha/Desktop/개발/1/soy-pillar-436505-e6-a84c54f9816a.json'
 
+# 에코옥션 설정
+DEFAULT_SITE = "ecoauc"  # 사이트를 따로 지정하지 않은 크롤링(봇, 미리 크롤링, 구독)에 쓰는 사이트
+ECOAUC_BASE_URL = "https://www.ecoauc.com"
+PAGE_DELAY = 1  # 페이지 요청 사이 대기 (초)
+
+# 펭귄옥션 설정 (crawlers/penguinAuc.js와 같은 계정 환경 변수)
+PENGUIN_BASE_URL = "https://penguin-auction.jp"
+PENGUIN_LOGIN_EMAIL = os.environ.get("CRAWLER_EMAIL5", "")
+PENGUIN_LOGIN_PASSWORD = os.environ.get("CRAWLER_PASSWORD5", "")
+PENGUIN_PAGE_DELAY = 0.5
+# 에코옥션 카테고리 ID → 펭귄옥션 카테고리 ID (악세서리/소품/신발은 해당 없음)
+PENGUIN_CATEGORY_IDS = {"1": "2", "2": "1", "3": "3", "8": "4", "27": "6"}
+
+# 로컬 경매품 저장소 설정
+RESULT_ROOT = os.path.join(os.path.expanduser("~"), "Desktop", "크롤링결과")
+LOT_DB_PATH = os.path.join(RESULT_ROOT, "lots.db")
+LOT_DB_BATCH_SIZE = 500
+
+# 검색 계획 설정
+BRAND_IDS_PATH = os.path.join(RESULT_ROOT, "brand_ids.json")
+BRAND_IDS_MAX_AGE_DAYS = 7
+QUERY_BRAND_BATCH = 30  # 한 요청의 브랜드 필터에 넣을 브랜드 수
+
+# 봇 인기 검색어 미리 크롤링 설정
+PREFETCH_TOP_N = 10
+PREFETCH_MAX_CRAWLS_PER_HOUR = 6  # 미리 크롤링에 쓸 시간당 크롤링 횟수
+PREFETCH_CHECK_INTERVAL = 600  # 초
+PREFETCH_FRESH_MINUTES = 60  # 이 시간 안의 크롤링 결과는 바로 응답에 사용
+PREFETCH_QUIET_HOURS = None  # 예: range(2, 7). None이면 봇 요청 기록에서 학습
+PREFETCH_AUCTION_LEAD_HOURS = 24  # 경매 시작 전 이 시간 안이면 한가한 시간이 아니어도 미리 크롤링
+PREFETCH_HISTORY_DAYS = 30
+PREFETCH_HALF_LIFE_DAYS = 7
+
+# 봇 구독 알림 설정
+WATCH_INTERVAL = 1800  # 구독 검색 재크롤링 주기 (초)
+WATCH_SNAPSHOT_RETENTION_DAYS = 7  # 크롤링 결과에서 빠진 경매품도 이 기간 동안은 스냅샷에 남겨 다시 '신규'로 알리지 않음
+TELEGRAM_MESSAGES_PER_SECOND = 25  # 텔레그램 전체 전송 제한(초당 30건)보다 약간 낮게
+TELEGRAM_CHAT_INTERVAL = 1.0  # 같은 채팅방에 보내는 메시지 사이 간격 (초)
+TELEGRAM_SEND_RETRIES = 3
+TELEGRAM_MESSAGE_LIMIT = 4000  # 텔레그램 메시지 최대 길이(4096자) 안으로
+
+# GUI 설정
+GUI_PROGRESS_INTERVAL = 0.1  # 진행 상황 신호 최소 간격 (초)
+GUI_IMAGE_BATCH_SIZE = 20  # 한 번에 표에 넣을 썸네일 수
+GUI_THUMBNAIL_SIZE = 100
+EXPORT_PROGRESS_ROWS = 100  # 엑셀 저장 진행 상황을 알릴 행 간격
+EXCEL_PROFILES = {"full": "이미지 포함", "linked": "이미지 링크", "data": "데이터만"}
+DEFAULT_EXCEL_PROFILE = "full"
+
+# 이미지 중복 찾기 설정
+IMAGE_HASH_MAX_DISTANCE = 6  # 64비트 dHash에서 이 해밍 거리 이내면 같은 사진으로 봄
+IMAGE_HASH_MIN_BITS = 4  # 단색/빈 이미지처럼 무늬가 거의 없는 해시는 중복 판단에 쓰지 않음
+IMAGE_THUMBNAIL_SIZE = 200  # thumbs/ 폴더에 저장할 썸네일 최대 크기 (px)
+
+# 분산 크롤링 설정 (coordinator / worker 모드)
+TASK_QUEUE_PATH = os.path.join(RESULT_ROOT, "task_queue.db")
+TASK_LEASE_SECONDS = 300  # 작업자가 이 시간 안에 끝내거나 연장하지 못하면 다른 작업자가 가져감
+TASK_MAX_ATTEMPTS = 3
+TASK_POLL_INTERVAL = 2.0  # 초
+TASK_QUEUE_TOKEN = os.environ.get("CRAWLER_QUEUE_TOKEN")  # coordinator --serve로 연 작업 큐에 접속할 때 쓰는 공유 토큰
+
+# 번역 설정 (용어집은 직접 편집, 캐시는 원격 번역 결과를 자동으로 쌓음)
+TRANSLATION_GLOSSARY_PATH = os.path.join(RESULT_ROOT, "translation_glossary.json")
+TRANSLATION_CACHE_PATH = os.path.join(RESULT_ROOT, "translation_cache.json")
+TRANSLATION_CACHE_SAVE_EVERY = 50  # 새 번역이 이만큼 쌓이면 캐시 파일에 저장
+
+# 외부 요청 재시도/타임아웃 설정 (timeout: (연결, 읽기) 초)
+# sheets는 get_sheets_client()에서 gspread 클라이언트에, translate는 make_translator()에서 httpx 클라이언트에 적용
+# (httpx는 튜플을 받지 않아 연결/읽기 공통 초)
+REQUEST_POLICIES = {
+    "login": {"timeout": (10, 30), "retries": 3},
+    "inspect": {"timeout": (10, 60), "retries": 4},
+    "image": {"timeout": (5, 30), "retries": 2},
+    "queue": {"timeout": (5, 30), "retries": 3},
+    "sheets": {"timeout": (10, 60), "retries": 5, "host": "sheets.googleapis.com",
+               "retry_on": (APIError, RequestException, ConnectionError, TimeoutError)},
+    "translate": {"timeout": 10.0, "retries": 2, "host": "translate.googleapis.com", "retry_on": (Exception,)},
+}
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 60.0
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60.0
+
+class CrawlCancelled(BaseException):
+    # 단계마다 있는 except Exception 처리에 삼켜지지 않도록 BaseException을 상속 (asyncio.CancelledError와 같은 방식)
+    pass
+
+class CrawlJob:
+    # 크롤링 한 건의 취소/일시정지 상태. 각 단계가 checkpoint()로 확인함
+    def __init__(self):
+        self.cancel_event = threading.Event()
+        self.run_event = threading.Event()
+        self.run_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    @property
+    def paused(self):
+        return not self.run_event.is_set() and not self.cancelled
+
+    def cancel(self):
+        self.cancel_event.set()
+        # 일시정지 중에 기다리던 작업도 깨워서 취소되게 함
+        self.run_event.set()
+
+    def pause(self):
+        if not self.cancelled:
+            self.run_event.clear()
+
+    def resume(self):
+        self.run_event.set()
+
+    def checkpoint(self):
+        # 일시정지 중이면 재개/취소될 때까지 기다리고, 취소됐으면 CrawlCancelled
+        self.run_event.wait()
+        if self.cancel_event.is_set():
+            raise CrawlCancelled()
+
+    def sleep(self, seconds):
+        # 대기 중에도 취소되면 바로 깨어남
+        if self.cancel_event.wait(seconds):
+            raise CrawlCancelled()
+        self.checkpoint()
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(retry_at.tzinfo)).total_seconds())
+
+class CircuitBreaker:
+    # 연속 실패가 쌓이면 해당 호스트 요청을 reset_timeout 동안 멈춤
+    def __init__(self, host, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_timeout=CIRCUIT_RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def remaining_pause(self):
+        with self.lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    print(f"{self.host}: 연속 실패 {self.failures}회, {self.reset_timeout:.0f}초 동안 요청을 멈춥니다.")
+                # 반개방 상태의 시험 요청이 실패해도 다시 멈춤
+                self.opened_at = time.monotonic()
+
+class Resilience:
+    def __init__(self, policies=REQUEST_POLICIES, failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout=CIRCUIT_RESET_TIMEOUT, backoff_base=RETRY_BACKOFF_BASE,
+                 backoff_max=RETRY_BACKOFF_MAX, sleep=time.sleep):
+        self.policies = policies
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sleep = sleep
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def breaker(self, host):
+        with self.lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+            return self.breakers[host]
+
+    def backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # 지수 백오프 + full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def wait_for_breaker(self, breaker, sleep=None):
+        pause = breaker.remaining_pause()
+        if pause > 0:
+            crawl_metrics.inc("circuit_pauses_total")
+            print(f"{breaker.host}: 회로 차단 중, {pause:.1f}초 대기")
+            (sleep or self.sleep)(pause)
+
+    def request(self, session, method, url, endpoint, job=None, **kwargs):
+        policy = self.policies[endpoint]
+        kwargs.setdefault("timeout", policy["timeout"])
+        breaker = self.breaker(urllib.parse.urlparse(url).netloc)
+        retries = policy["retries"]
+        # 작업이 주어지면 재시도 대기 중에도 취소/일시정지를 따름
+        sleep = job.sleep if job else self.sleep
+
+        for attempt in range(retries + 1):
+            if job:
+                job.checkpoint()
+            self.wait_for_breaker(breaker, sleep)
+            try:
+                response = (session or requests).request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                breaker.record_failure()
+                if attempt == retries:
+                    raise
+                delay = self.backoff(attempt)
+                crawl_metrics.inc("http_retries_total")
+                print(f"[{endpoint}] 요청 실패 ({e.__class__.__name__}), {delay:.1f}초 후 재시도 ({attempt + 1}/{retries})")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if attempt == retries:
+                    return response
+                delay = self.backoff(attempt, parse_retry_after(response.headers.get("Retry-After")))
+                crawl_metrics.inc("http_retries_total")
+                print(f"[{endpoint}] 상태 코드 {response.status_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{retries})")
+            sleep(delay)
+
+    def call(self, func, *args, endpoint, job=None, **kwargs):
+        # gspread, googletrans처럼 자체 클라이언트를 쓰는 호출용
+        policy = self.policies[endpoint]
+        breaker = self.breaker(policy["host"])
+        retries = policy["retries"]
+        sleep = job.sleep if job else self.sleep
+
+        for attempt in range(retries + 1):
+            if job:
+                job.checkpoint()
+            self.wait_for_breaker(breaker, sleep)
+            try:
+                result = func(*args, **kwargs)
+            except policy["retry_on"] as e:
+                response = getattr(e, "response", None)
+                status_code = getattr(response, "status_code", None)
+                if status_code is not None and status_code not in RETRY_STATUS_CODES:
+                    raise
+                breaker.record_failure()
+                if attempt == retries:
+                    raise
+                retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+                delay = self.backoff(attempt, retry_after)
+                crawl_metrics.inc("api_retries_total")
+                print(f"[{endpoint}] 호출 실패 ({e}), {delay:.1f}초 후 재시도 ({attempt + 1}/{retries})")
+                sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+
+resilience = Resilience()
+
+def fetch(session, url, endpoint, method="GET", job=None, **kwargs):
+    return resilience.request(session, method, url, endpoint, job=job, **kwargs)
+
+# 크롤링 단계별 측정 설정
+METRICS_LOG_PATH = os.path.join(RESULT_ROOT, "crawl_metrics.jsonl")
+METRICS_PORT = int(os.environ.get("CRAWLER_METRICS_PORT", "0")) or None  # 예: 9108
+METRICS_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+class CrawlMetrics:
+    # 단계(login, page_fetch, parse, translate, image_download, export)별 시간 히스토그램과 카운터/게이지
+    def __init__(self, log_path=METRICS_LOG_PATH, buckets=METRICS_BUCKETS):
+        self.log_path = log_path
+        self.buckets = buckets
+        self.counters = {}
+        self.gauges = {}
+        self.stages = {}
+        self.lock = threading.Lock()
+
+    def inc(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        with self.lock:
+            self.gauges[name] = value
+
+    def observe(self, stage, seconds):
+        with self.lock:
+            hist = self.stages.setdefault(stage, {"count": 0, "sum": 0.0, "max": 0.0, "buckets": [0] * len(self.buckets)})
+            hist["count"] += 1
+            hist["sum"] += seconds
+            hist["max"] = max(hist["max"], seconds)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    hist["buckets"][i] += 1
+                    break
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc(f"{name}_errors_total")
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def percentile(self, hist, fraction):
+        # 버킷 상한으로 근사
+        target = hist["count"] * fraction
+        seen = 0
+        for bound, count in zip(self.buckets, hist["buckets"]):
+            seen += count
+            if seen >= target:
+                return bound
+        return hist["max"]
+
+    def summarize(self, hists):
+        stages = {}
+        for name, hist in hists.items():
+            stages[name] = {
+                "count": hist["count"],
+                "total": round(hist["sum"], 3),
+                "avg": round(hist["sum"] / hist["count"], 3) if hist["count"] else 0.0,
+                "p50": self.percentile(hist, 0.5),
+                "p95": self.percentile(hist, 0.95),
+                "max": round(hist["max"], 3)
+            }
+        return stages
+
+    def snapshot(self):
+        with self.lock:
+            return {"counters": dict(self.counters), "gauges": dict(self.gauges), "stages": self.summarize(self.stages)}
+
+    def mark(self):
+        # 지금까지의 누적값. 크롤링 시작 때 잡아 두고 since()로 그 뒤 증가분만 봄
+        with self.lock:
+            return {"counters": dict(self.counters),
+                    "stages": {name: dict(hist, buckets=list(hist["buckets"])) for name, hist in self.stages.items()}}
+
+    def since(self, mark):
+        # mark() 이후 증가분 (같은 시간에 돈 다른 크롤링의 값도 섞일 수 있음). 게이지는 현재 값
+        with self.lock:
+            counters = {name: value - mark["counters"].get(name, 0) for name, value in self.counters.items()
+                        if value != mark["counters"].get(name, 0)}
+            hists = {}
+            for name, hist in self.stages.items():
+                before = mark["stages"].get(name, {"count": 0, "sum": 0.0, "buckets": [0] * len(self.buckets)})
+                count = hist["count"] - before["count"]
+                if not count:
+                    continue
+                buckets = [now - then for now, then in zip(hist["buckets"], before["buckets"])]
+                # 구간 최댓값은 따로 모으지 않으므로 값이 들어간 가장 큰 버킷 상한으로 근사
+                filled = [bound for bound, bucket_count in zip(self.buckets, buckets) if bucket_count]
+                overflow = count > sum(buckets)
+                hists[name] = {"count": count, "sum": hist["sum"] - before["sum"], "buckets": buckets,
+                               "max": hist["max"] if overflow or not filled else min(filled[-1], hist["max"])}
+            return {"counters": counters, "gauges": dict(self.gauges), "stages": self.summarize(hists)}
+
+    def log_event(self, event, **fields):
+        record = {"ts": datetime.datetime.now().isoformat(timespec="seconds"), "event": event}
+        record.update(fields)
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with self.lock, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"측정 로그 기록 실패: {e}")
+
+    def to_prometheus(self):
+        lines = []
+        with self.lock:
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE crawler_{name} counter")
+                lines.append(f"crawler_{name} {value}")
+            for name, value in sorted(self.gauges.items()):
+                lines.append(f"# TYPE crawler_{name} gauge")
+                lines.append(f"crawler_{name} {value}")
+            lines.append("# TYPE crawler_stage_seconds histogram")
+            for name, hist in sorted(self.stages.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, hist["buckets"]):
+                    cumulative += count
+                    lines.append(f'crawler_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'crawler_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {hist["count"]}')
+                lines.append(f'crawler_stage_seconds_sum{{stage="{name}"}} {hist["sum"]:.6f}')
+                lines.append(f'crawler_stage_seconds_count{{stage="{name}"}} {hist["count"]}')
+        return "\n".join(lines) + "\n"
+
+crawl_metrics = CrawlMetrics()
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = crawl_metrics.to_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_metrics_server(port=METRICS_PORT):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"측정 엔드포인트: http://127.0.0.1:{server.server_address[1]}/metrics")
+    return server
+
+@crawl_metrics.timed("login")
 def login_and_check():
     session = requests.Session()
-    login_url = "https://www.ecoauc.com/client/users/post-sign-in"
+    login_url = f"{ECOAUC_BASE_URL}/client/users/post-sign-in"
     login_data = {
         "_method": "POST",
         "_csrfToken": "",
@@ -49,7 +506,7 @@ def login_and_check():
     }
 
     print("로그인 페이지 접근 중...")
-    login_page = session.get("https://www.ecoauc.com/client/users/sign-in", headers=headers)
+    login_page = fetch(session, f"{ECOAUC_BASE_URL}/client/users/sign-in", "login", headers=headers)
     print(f"로그인 페이지 상태 코드: {login_page.status_code}")
 
     soup = BeautifulSoup(login_page.text, 'html.parser')
@@ -58,18 +515,18 @@ def login_and_check():
     print(f"CSRF 토큰 찾음: {csrf_token}")
 
     print("로그인 시도 중...")
-    login_response = session.post(login_url, data=login_data, headers=headers, allow_redirects=False)
+    login_response = fetch(session, login_url, "login", method="POST", data=login_data, headers=headers, allow_redirects=False)
     print(f"Login status code: {login_response.status_code}")
 
     if login_response.status_code == 302:
         redirect_url = login_response.headers['Location']
         print(f"리다이렉트 URL: {redirect_url}")
-        home_page = session.get(redirect_url, headers=headers)
+        home_page = fetch(session, redirect_url, "login", headers=headers)
         print(f"홈페이지 상태 코드: {home_page.status_code}")
 
         print("アカウント 페이지 접근 중...")
-        account_url = "https://www.ecoauc.com/client/users"
-        account_page = session.get(account_url, headers=headers)
+        account_url = f"{ECOAUC_BASE_URL}/client/users"
+        account_page = fetch(session, account_url, "login", headers=headers)
         print(f"アカウント 페이지 상태 코드: {account_page.status_code}")
 
         soup = BeautifulSoup(account_page.text, 'html.parser')
@@ -83,10 +540,822 @@ def login_and_check():
         print("로그인 실패.")
         return None
 
-def get_total_pages(session, base_url, params):
-    response = session.get(base_url, params=params)
-    soup = BeautifulSoup(response.text, 'html.parser')
+def create_output_folder(brand):
+    output_folder = os.path.join(RESULT_ROOT, brand)
+    os.makedirs(output_folder, exist_ok=True)
+    return output_folder
+
+@crawl_metrics.timed("image_download")
+def download_image(image_url, save_dir, job=None, adapter=None):
+    if job:
+        job.checkpoint()
+    try:
+        adapter = adapter or SITE_ADAPTERS[DEFAULT_SITE]
+        new_url = adapter.normalize_image_url(image_url)
+
+        # 이어서 크롤링할 때 이미 받은 이미지는 다시 받지 않음
+        file_name = os.path.join(save_dir, os.path.basename(urllib.parse.urlparse(image_url).path))
+        if os.path.exists(file_name):
+            return file_name
+
+        response = fetch(None, new_url, "image", job=job, headers=adapter.image_headers)
+        if response.status_code == 200:
+            crawl_metrics.inc("image_download_bytes_total", len(response.content))
+            crawl_metrics.inc("images_downloaded_total")
+            os.makedirs(save_dir, exist_ok=True)
+            with open(file_name, 'wb') as f:
+                f.write(response.content)
+            return file_name
+    except Exception as e:
+        print(f"Error downloading image {image_url}: {e}")
+    return None
+
+# 경매 제목에 반복해서 나오는 단어 (일본어 → 한국어). translation_glossary.json에 적은 항목이 이 목록보다 우선
+TRANSLATION_GLOSSARY = {
+    # 브랜드
+    "シャネル": "샤넬", "ルイヴィトン": "루이비통", "ルイ・ヴィトン": "루이비통", "エルメス": "에르메스", "グッチ": "구찌",
+    "プラダ": "프라다", "ロレックス": "롤렉스", "オメガ": "오메가", "カルティエ": "까르띠에", "ブルガリ": "불가리",
+    "ティファニー": "티파니", "セリーヌ": "셀린느", "ディオール": "디올", "フェンディ": "펜디", "バレンシアガ": "발렌시아가",
+    "ボッテガヴェネタ": "보테가베네타", "ボッテガ・ヴェネタ": "보테가베네타", "ロエベ": "로에베", "サンローラン": "생로랑",
+    "ゴヤール": "고야드", "コーチ": "코치", "ミュウミュウ": "미우미우", "ジバンシィ": "지방시", "バーバリー": "버버리",
+    "フェラガモ": "페라가모", "クロムハーツ": "크롬하츠", "モンクレール": "몽클레르", "タグホイヤー": "태그호이어",
+    "パネライ": "파네라이", "ウブロ": "위블로", "ブライトリング": "브라이틀링", "チュードル": "튜더", "チューダー": "튜더",
+    "セイコー": "세이코", "シチズン": "시티즌", "カシオ": "카시오", "ヴァンクリーフ&アーペル": "반클리프 아펠",
+    # 품목
+    "バッグ": "가방", "ハンドバッグ": "핸드백", "ショルダーバッグ": "숄더백", "チェーンショルダーバッグ": "체인 숄더백",
+    "トートバッグ": "토트백", "ボストンバッグ": "보스턴백", "クラッチバッグ": "클러치백", "セカンドバッグ": "세컨드백",
+    "リュック": "백팩", "リュックサック": "백팩", "ポーチ": "파우치", "財布": "지갑", "長財布": "장지갑",
+    "二つ折り財布": "반지갑", "三つ折り財布": "3단 지갑", "コインケース": "동전지갑", "カードケース": "카드지갑",
+    "キーケース": "키케이스", "名刺入れ": "명함지갑", "ウォレット": "월렛", "腕時計": "손목시계", "時計": "시계",
+    "ネックレス": "목걸이", "ブレスレット": "팔찌", "リング": "반지", "指輪": "반지", "ピアス": "피어스",
+    "イヤリング": "귀걸이", "ブローチ": "브로치", "ペンダント": "펜던트", "ベルト": "벨트", "スカーフ": "스카프",
+    "ストール": "스톨", "マフラー": "머플러", "サングラス": "선글라스", "ネクタイ": "넥타이", "キーホルダー": "키홀더",
+    "チャーム": "참", "ジャケット": "재킷", "コート": "코트", "ワンピース": "원피스", "スニーカー": "스니커즈",
+    "パンプス": "펌프스", "ブーツ": "부츠", "サンダル": "샌들", "ローファー": "로퍼",
+    # 소재
+    "レザー": "가죽", "革": "가죽", "カーフ": "카프스킨", "ラムスキン": "램스킨", "キャビアスキン": "캐비어스킨",
+    "キャンバス": "캔버스", "ナイロン": "나일론", "エナメル": "에나멜", "スエード": "스웨이드", "デニム": "데님",
+    "ツイード": "트위드", "クロコダイル": "크로커다일", "オーストリッチ": "타조가죽", "パイソン": "파이톤",
+    "ステンレス": "스테인리스", "ステンレススチール": "스테인리스 스틸", "ゴールド": "골드", "シルバー": "실버",
+    "プラチナ": "플래티넘", "白金": "플래티넘", "ダイヤ": "다이아", "ダイヤモンド": "다이아몬드", "パール": "진주",
+    "真珠": "진주", "ホワイトゴールド": "화이트골드", "ピンクゴールド": "핑크골드", "イエローゴールド": "옐로골드",
+    "セラミック": "세라믹", "チタン": "티타늄", "ラバー": "러버", "金具": "장식",
+    # 색상
+    "ブラック": "블랙", "黒": "블랙", "ホワイト": "화이트", "白": "화이트", "レッド": "레드", "赤": "레드",
+    "ブルー": "블루", "青": "블루", "ネイビー": "네이비", "ピンク": "핑크", "ベージュ": "베이지", "ブラウン": "브라운",
+    "茶": "브라운", "グレー": "그레이", "グリーン": "그린", "イエロー": "옐로", "オレンジ": "오렌지", "パープル": "퍼플",
+    "ボルドー": "보르도", "マルチカラー": "멀티컬러",
+    # 상태/구성/무늬
+    "自動巻き": "오토매틱", "手巻き": "수동", "クォーツ": "쿼츠", "文字盤": "다이얼", "箱": "박스", "保証書": "보증서",
+    "付属品": "부속품", "付き": "포함", "メンズ": "남성용", "レディース": "여성용", "ボーイズ": "보이즈", "中古": "중고",
+    "美品": "상태 좋음", "新品": "새 상품", "未使用": "미사용", "ヴィンテージ": "빈티지", "限定": "한정", "ロゴ": "로고",
+    "モノグラム": "모노그램", "ダミエ": "다미에", "マトラッセ": "마트라쎄", "ココマーク": "코코마크", "総柄": "총패턴",
+    "約": "약",
+    # 경매 일정
+    "エコオク": "에코옥", "オークション": "경매", "開催": "개최", "開始": "시작", "終了": "종료", "締切": "마감", "予定": "예정",
+}
+
+TRANSLATION_WEEKDAYS = {"月": "월", "火": "화", "水": "수", "木": "목", "金": "금", "土": "토", "日": "일"}
+
+# 경매 일정 등 형식이 정해진 부분 (용어집보다 먼저 적용)
+TRANSLATION_TEMPLATES = [
+    (re.compile(r"(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"), r"\1년 \2월 \3일"),
+    (re.compile(r"(\d{1,2})\s*月\s*(\d{1,2})\s*日"), r"\1월 \2일"),
+    (re.compile(r"\(\s*([月火水木金土日])\s*\)"), lambda match: f"({TRANSLATION_WEEKDAYS[match.group(1)]})"),
+    (re.compile(r"(\d{1,2})\s*時\s*(\d{1,2})\s*分"), r"\1시 \2분"),
+    # 24時間 같은 합성어는 건드리지 않고 시각만
+    (re.compile(r"(\d{1,2})\s*時(?![間計])"), r"\1시"),
+]
+
+JAPANESE_CHARS = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]")  # 히라가나, 가타카나, 한자
+
+class TranslationEngine:
+    # 용어집과 정해진 형식으로 먼저 번역하고, 남은 일본어 구간만 원격 번역기로 보냄 (결과는 파일에 캐시)
+    def __init__(self, glossary_path=TRANSLATION_GLOSSARY_PATH, cache_path=TRANSLATION_CACHE_PATH,
+                 save_every=TRANSLATION_CACHE_SAVE_EVERY):
+        self.glossary_path = glossary_path
+        self.cache_path = cache_path
+        self.save_every = save_every
+        self.lock = threading.Lock()
+        self.glossary = None
+        self.cache = None
+        self.unsaved = 0
+        self.stats = {"requests": 0, "local": 0, "cached": 0, "remote": 0, "failed": 0}
+
+    def load(self):
+        # 처음 번역할 때 한 번만 읽음
+        if self.glossary is not None:
+            return
+        glossary = dict(TRANSLATION_GLOSSARY)
+        glossary.update(self.read_json(self.glossary_path))
+        self.glossary = {unicodedata.normalize("NFKC", ja): ko for ja, ko in glossary.items()}
+        self.cache = self.read_json(self.cache_path)
+
+    @staticmethod
+    def read_json(path):
+        # 파일이 없거나 깨져 있으면 빈 사전 (용어집은 기본 목록만, 캐시는 처음부터)
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"번역 파일을 읽지 못해 무시합니다 ({path}): {e}")
+            return {}
+        if not isinstance(data, dict):
+            print(f"번역 파일 형식이 올바르지 않아 무시합니다 ({path})")
+            return {}
+        return {str(key): str(value) for key, value in data.items()}
+
+    def translate_locally(self, text):
+        # (번역문, 남은 일본어 구간 목록). 구간은 번역문 안에 원문 그대로 남아 있음
+        text = unicodedata.normalize("NFKC", text)
+        for pattern, replacement in TRANSLATION_TEMPLATES:
+            text = pattern.sub(replacement, text)
+
+        # 공백 단위로 용어집에 통째로 있는 단어만 바꿈 (일부만 바꾸면 원격 번역 품질이 떨어짐)
+        words = []
+        leftovers = []
+        run = []
+        for word in text.split():
+            if word in self.glossary:
+                word = self.glossary[word]
+            elif JAPANESE_CHARS.search(word):
+                run.append(word)
+                continue
+            if run:
+                leftovers.append(" ".join(run))
+                words.append(leftovers[-1])
+                run = []
+            words.append(word)
+        if run:
+            leftovers.append(" ".join(run))
+            words.append(leftovers[-1])
+        return " ".join(words), leftovers
+
+    def translate(self, translator, text, job=None, src="ja"):
+        with self.lock:
+            self.load()
+            self.stats["requests"] += 1
+        crawl_metrics.inc("translate_requests_total")
+
+        if src == "ja":
+            translated, leftovers = self.translate_locally(text)
+        else:
+            translated, leftovers = text, [text]
+        if not leftovers:
+            self.record("local")
+            return translated
+
+        outcome = "cached"
+        for segment in leftovers:
+            key = f"{src}:{segment}"
+            with self.lock:
+                result = self.cache.get(key)
+            if result is None:
+                try:
+                    result = resilience.call(translator.translate, segment, src=src, dest='ko', endpoint="translate", job=job).text
+                except Exception as e:
+                    # 번역하지 못한 구간은 원문으로 남김
+                    print(f"Translation error: {e}")
+                    outcome = "failed"
+                    continue
+                if outcome == "cached":
+                    outcome = "remote"
+                self.remember(key, result)
+            translated = translated.replace(segment, result, 1) if src == "ja" else result
+        self.record(outcome)
+        return translated
+
+    def record(self, outcome):
+        crawl_metrics.inc(f"translate_{outcome}_total")
+        with self.lock:
+            self.stats[outcome] += 1
+            stats = dict(self.stats)
+        # 원격 호출 없이 끝난 비율
+        crawl_metrics.set_gauge("translate_offline_ratio", round((stats["local"] + stats["cached"]) / stats["requests"], 3))
+
+    def remember(self, key, value):
+        with self.lock:
+            self.cache[key] = value
+            self.unsaved += 1
+            if self.unsaved < self.save_every:
+                return
+        self.save()
+
+    def save(self):
+        # 작업자 프로세스 여럿이 같은 캐시 파일을 쓰므로 디스크 내용과 합친 뒤 프로세스별 임시 파일로 교체
+        # 저장에 실패해도 번역은 계속함 (다음 저장 때 다시 시도)
+        with self.lock:
+            if not self.unsaved or not self.cache_path:
+                return
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+                with open(self.cache_path + ".lock", "a") as lock_file:
+                    # 읽고 합쳐서 쓰는 동안 다른 프로세스가 끼어들지 않게 잠금
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    merged = self.read_json(self.cache_path)
+                    merged.update(self.cache)
+                    with open(temp_path, "w", encoding="utf-8") as f:
+                        json.dump(merged, f, ensure_ascii=False)
+                    os.replace(temp_path, self.cache_path)
+            except OSError as e:
+                print(f"번역 캐시를 저장하지 못했습니다: {e}")
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
+                return
+            self.cache = merged
+            self.unsaved = 0
+
+translation_engine = TranslationEngine()
+atexit.register(translation_engine.save)
+
+def make_translator():
+    return Translator(timeout=REQUEST_POLICIES["translate"]["timeout"])
+
+@crawl_metrics.timed("translate")
+def translate_text(translator, text, job=None, src='ja'):
+    try:
+        return translation_engine.translate(translator, text, job, src)
+    except Exception as e:
+        print(f"Translation error: {e}")
+    return text
+
+def currency_to_int(text):
+    if not text:
+        return None
+    digits = re.sub(r"[^\d]", "", text)
+    return int(digits) if digits else None
+
+def extract_date(text):
+    # 경매 일정 문자열에서 날짜/시간 추출 (번역 전 원문 기준)
+    if not text:
+        return None
+
+    match = re.search(r"(\d{4})\s*[年./-]\s*(\d{1,2})\s*[月./-]\s*(\d{1,2})", text)
+    if not match:
+        return None
+    year, month, day = (int(v) for v in match.groups())
+
+    hour, minute = 0, 0
+    time_match = re.search(r"(\d{1,2})\s*[:：]\s*(\d{2})", text[match.end():])
+    if time_match:
+        hour, minute = (int(v) for v in time_match.groups())
+
+    try:
+        return datetime.datetime(year, month, day, hour, minute).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+def extract_lot_id(item, image_url=None):
+    id_elem = item.find(attrs={"data-auction-item-id": True})
+    if id_elem:
+        return id_elem["data-auction-item-id"]
+
+    # 대체 방법: 이미지 URL의 상품 번호 (예: /item/20251105/257903351-1-xxx.jpg)
+    if image_url:
+        match = re.search(r"/item/\d+/(\d+)-", image_url)
+        if match:
+            return match.group(1)
+    return None
+
+def intern_text(value):
+    # BeautifulSoup의 NavigableString 등 str 하위 타입은 intern 할 수 없어 str로 변환
+    return sys.intern(str(value)) if isinstance(value, str) else value
+
+class Lot:
+    # 경매품 한 건. 브랜드/등급/카테고리/경매 일정처럼 반복되는 문자열은 intern 해서 공유
+    __slots__ = ("id", "brand", "category", "title", "rank", "starting_price", "image_url", "image", "time", "date", "relist_of")
+
+    def __init__(self, id, brand, category, title, rank, starting_price, image_url=None, image=None, time=None, date=None, relist_of=None):
+        self.id = id
+        self.brand = intern_text(brand)
+        self.category = intern_text(category)
+        self.title = title
+        self.rank = intern_text(rank)
+        self.starting_price = starting_price
+        self.image_url = image_url
+        self.image = image
+        self.time = intern_text(time)
+        self.date = intern_text(date)
+        self.relist_of = relist_of  # 같은 사진으로 먼저 올라온 경매품 ID (재출품)
+
+    @property
+    def price(self):
+        return currency_to_int(self.starting_price)
+
+    def row(self):
+        return [self.brand, self.title, self.rank, self.starting_price, self.image, self.time]
+
+    def to_dict(self):
+        # 체크포인트 등 JSON 저장용 (기존 열 이름 유지)
+        return {
+            "ID": self.id,
+            "Brand": self.brand,
+            "Category": self.category,
+            "Title": self.title,
+            "Rank": self.rank,
+            "Starting Price": self.starting_price,
+            "Image URL": self.image_url,
+            "Image": self.image,
+            "Time": self.time,
+            "Date": self.date,
+            "Relist Of": self.relist_of
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("ID"), data["Brand"], data.get("Category"), data["Title"], data["Rank"],
+                   data["Starting Price"], data.get("Image URL"), data.get("Image"), data.get("Time"), data.get("Date"),
+                   data.get("Relist Of"))
+
+    def __repr__(self):
+        return f"Lot({self.id!r}, {self.brand!r}, {self.title!r}, {self.starting_price!r})"
+
+class LotStore:
+    def __init__(self, db_path=LOT_DB_PATH):
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+    def create_tables(self):
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS lots (
+                    lot_id TEXT PRIMARY KEY,
+                    brand TEXT NOT NULL,
+                    category TEXT,
+                    title TEXT,
+                    rank TEXT,
+                    starting_price TEXT,
+                    price INTEGER,
+                    image_url TEXT,
+                    image TEXT,
+                    market_time TEXT,
+                    auction_date TEXT,
+                    relist_of TEXT,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_lots_brand_category_price ON lots (brand, category, price);
+                CREATE INDEX IF NOT EXISTS idx_lots_category ON lots (category);
+                CREATE INDEX IF NOT EXISTS idx_lots_auction_date ON lots (auction_date);
+                CREATE INDEX IF NOT EXISTS idx_lots_price ON lots (price);
+                CREATE INDEX IF NOT EXISTS idx_lots_last_seen ON lots (last_seen);
+
+                CREATE TABLE IF NOT EXISTS query_log (
+                    brand TEXT NOT NULL,
+                    category TEXT,
+                    requested_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_query_log_requested_at ON query_log (requested_at);
+
+                CREATE TABLE IF NOT EXISTS crawl_runs (
+                    brand TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    crawled_at TEXT NOT NULL,
+                    item_count INTEGER,
+                    PRIMARY KEY (brand, category)
+                );
+
+                CREATE TABLE IF NOT EXISTS watches (
+                    chat_id INTEGER NOT NULL,
+                    brand TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    label TEXT,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (chat_id, brand, category)
+                );
+
+                CREATE TABLE IF NOT EXISTS watch_snapshots (
+                    brand TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    lot_id TEXT NOT NULL,
+                    price INTEGER,
+                    last_seen TEXT,
+                    PRIMARY KEY (brand, category, lot_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS watch_seeded (
+                    brand TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    seeded_at TEXT NOT NULL,
+                    PRIMARY KEY (brand, category)
+                );
+
+                CREATE TABLE IF NOT EXISTS spreadsheets (
+                    brand TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    spreadsheet_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (brand, category)
+                );
+
+                CREATE TABLE IF NOT EXISTS image_hashes (
+                    hash TEXT PRIMARY KEY,
+                    image_path TEXT NOT NULL,
+                    thumb_path TEXT,
+                    lot_id TEXT,
+                    first_seen TEXT NOT NULL
+                );
+            """)
+            # 이전 버전 DB에는 relist_of 열이 없음
+            columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(lots)")}
+            if "relist_of" not in columns:
+                self.conn.execute("ALTER TABLE lots ADD COLUMN relist_of TEXT")
+            # 이전 버전의 스냅샷은 통째로 교체하던 것이라 last_seen이 없음. 있던 스냅샷은 시작된 것으로 봄
+            columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(watch_snapshots)")}
+            if "last_seen" not in columns:
+                now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.conn.execute("ALTER TABLE watch_snapshots ADD COLUMN last_seen TEXT")
+                self.conn.execute("UPDATE watch_snapshots SET last_seen = ?", (now,))
+                self.conn.execute("""
+                    INSERT OR IGNORE INTO watch_seeded (brand, category, seeded_at)
+                    SELECT DISTINCT brand, category, ? FROM watch_snapshots
+                """, (now,))
+
+    def upsert_lots(self, items, batch_size=LOT_DB_BATCH_SIZE):
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [(
+            lot.id, lot.brand, lot.category, lot.title, lot.rank, lot.starting_price, lot.price,
+            lot.image_url, lot.image, lot.time, lot.date, lot.relist_of, now, now
+        ) for lot in items if lot.id]
+
+        # 배치 단위로 한 트랜잭션씩 저장
+        for start in range(0, len(rows), batch_size):
+            with self.lock, self.conn:
+                self.conn.executemany("""
+                    INSERT INTO lots (lot_id, brand, category, title, rank, starting_price, price,
+                                      image_url, image, market_time, auction_date, relist_of, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(lot_id) DO UPDATE SET
+                        brand = excluded.brand,
+                        category = COALESCE(excluded.category, lots.category),
+                        title = excluded.title,
+                        rank = excluded.rank,
+                        starting_price = excluded.starting_price,
+                        price = excluded.price,
+                        image_url = COALESCE(excluded.image_url, lots.image_url),
+                        image = COALESCE(excluded.image, lots.image),
+                        market_time = excluded.market_time,
+                        auction_date = COALESCE(excluded.auction_date, lots.auction_date),
+                        relist_of = COALESCE(excluded.relist_of, lots.relist_of),
+                        last_seen = excluded.last_seen
+                """, rows[start:start + batch_size])
+        return len(rows)
+
+    def query_lots(self, brand=None, category=None, min_price=None, max_price=None, current_only=True, seen_since=None, limit=100):
+        conditions = []
+        params = []
+        if brand:
+            conditions.append("brand = ?")
+            params.append(brand)
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+        if min_price is not None:
+            conditions.append("price >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            conditions.append("price <= ?")
+            params.append(max_price)
+        if current_only:
+            conditions.append("(auction_date IS NULL OR auction_date >= ?)")
+            params.append(datetime.date.today().strftime("%Y-%m-%d"))
+        if seen_since:
+            conditions.append("last_seen >= ?")
+            params.append(seen_since.strftime("%Y-%m-%d %H:%M:%S"))
+
+        sql = "SELECT * FROM lots"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY price"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [Lot(row["lot_id"], row["brand"], row["category"], row["title"], row["rank"], row["starting_price"],
+                    row["image_url"], row["image"], row["market_time"], row["auction_date"], row["relist_of"]) for row in rows]
+
+    def record_query(self, brand, category):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT INTO query_log (brand, category, requested_at) VALUES (?, ?, ?)",
+                              (brand, category, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+    def recent_queries(self, days=PREFETCH_HISTORY_DAYS):
+        since = (datetime.datetime.now() - datetime.timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+        with self.lock:
+            rows = self.conn.execute("SELECT brand, category, requested_at FROM query_log WHERE requested_at >= ?",
+                                     (since,)).fetchall()
+        return [(row["brand"], row["category"], datetime.datetime.strptime(row["requested_at"], "%Y-%m-%d %H:%M:%S"))
+                for row in rows]
+
+    def mark_crawled(self, brand, category, started_at, item_count):
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO crawl_runs (brand, category, crawled_at, item_count) VALUES (?, ?, ?, ?)
+                ON CONFLICT(brand, category) DO UPDATE SET crawled_at = excluded.crawled_at, item_count = excluded.item_count
+            """, (brand, category, started_at.strftime("%Y-%m-%d %H:%M:%S"), item_count))
+
+    def last_crawled(self, brand, category):
+        with self.lock:
+            row = self.conn.execute("SELECT crawled_at FROM crawl_runs WHERE brand = ? AND category = ?",
+                                    (brand, category)).fetchone()
+        return datetime.datetime.strptime(row["crawled_at"], "%Y-%m-%d %H:%M:%S") if row else None
+
+    def warm_lots(self, brand, category, max_age_minutes=PREFETCH_FRESH_MINUTES):
+        # 최근 크롤링 결과가 있으면 그 크롤링에서 본 경매품만 돌려줌 (없으면 None)
+        crawled_at = self.last_crawled(brand, category)
+        if not crawled_at or datetime.datetime.now() - crawled_at > datetime.timedelta(minutes=max_age_minutes):
+            return None
+        return self.query_lots(brand=brand, category=category, seen_since=crawled_at, limit=None)
+
+    def next_auction_date(self, brand, category):
+        with self.lock:
+            row = self.conn.execute("""
+                SELECT MIN(auction_date) AS next_date FROM lots
+                WHERE brand = ? AND category = ? AND auction_date >= ?
+            """, (brand, category, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))).fetchone()
+        return datetime.datetime.strptime(row["next_date"], "%Y-%m-%d %H:%M:%S") if row and row["next_date"] else None
+
+    def add_watch(self, chat_id, brand, category, label):
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO watches (chat_id, brand, category, label, created_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(chat_id, brand, category) DO UPDATE SET label = excluded.label
+            """, (chat_id, brand, category, label, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+    def remove_watch(self, chat_id, brand=None, category=None):
+        sql = "DELETE FROM watches WHERE chat_id = ?"
+        params = [chat_id]
+        if brand:
+            sql += " AND brand = ? AND category = ?"
+            params += [brand, category]
+        with self.lock, self.conn:
+            return self.conn.execute(sql, params).rowcount
+
+    def list_watches(self, chat_id=None):
+        sql = "SELECT chat_id, brand, category, label FROM watches"
+        params = []
+        if chat_id is not None:
+            sql += " WHERE chat_id = ?"
+            params.append(chat_id)
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(sql + " ORDER BY created_at", params).fetchall()]
+
+    def diff_snapshot(self, brand, category, items, retention_days=WATCH_SNAPSHOT_RETENTION_DAYS):
+        # 지난 스냅샷과 비교해 (신규, [(가격 변동품, 이전 가격)]) 반환 후 이번에 본 경매품을 스냅샷에 반영
+        # 처음 비교하는 검색이면 기준만 저장하고 빈 결과를 돌려줌 (처음 결과가 0건이어도 시작한 것으로 기록)
+        # 이번 결과에 없는 경매품은 바로 지우지 않아서, 일부만 받아진 크롤링 뒤에 다시 '신규'로 알리지 않음
+        now = datetime.datetime.now()
+        expires = (now - datetime.timedelta(days=retention_days)).strftime("%Y-%m-%d %H:%M:%S")
+        now = now.strftime("%Y-%m-%d %H:%M:%S")
+        with self.lock, self.conn:
+            seeded = self.conn.execute("SELECT 1 FROM watch_seeded WHERE brand = ? AND category = ?",
+                                       (brand, category)).fetchone()
+            previous = {row["lot_id"]: row["price"] for row in self.conn.execute(
+                "SELECT lot_id, price FROM watch_snapshots WHERE brand = ? AND category = ?", (brand, category))}
+            self.conn.executemany("""
+                INSERT INTO watch_snapshots (brand, category, lot_id, price, last_seen) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(brand, category, lot_id) DO UPDATE SET price = excluded.price, last_seen = excluded.last_seen
+            """, [(brand, category, lot.id, lot.price, now) for lot in items if lot.id])
+            self.conn.execute("DELETE FROM watch_snapshots WHERE brand = ? AND category = ? AND last_seen < ?",
+                              (brand, category, expires))
+            self.conn.execute("INSERT OR IGNORE INTO watch_seeded (brand, category, seeded_at) VALUES (?, ?, ?)",
+                              (brand, category, now))
+
+        if not seeded:
+            return [], []
+        new_lots = [lot for lot in items if lot.id and lot.id not in previous]
+        changed = [(lot, previous[lot.id]) for lot in items
+                   if lot.id in previous and lot.price is not None and lot.price != previous[lot.id]]
+        return new_lots, changed
+
+    def get_spreadsheet(self, brand, category):
+        with self.lock:
+            row = self.conn.execute("SELECT spreadsheet_id, url FROM spreadsheets WHERE brand = ? AND category = ?",
+                                    (brand, category)).fetchone()
+        return dict(row) if row else None
+
+    def register_spreadsheet(self, brand, category, spreadsheet_id, url):
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO spreadsheets (brand, category, spreadsheet_id, url, created_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(brand, category) DO UPDATE SET spreadsheet_id = excluded.spreadsheet_id, url = excluded.url,
+                    created_at = excluded.created_at
+            """, (brand, category, spreadsheet_id, url, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+    def load_image_hashes(self):
+        with self.lock:
+            rows = self.conn.execute("SELECT hash, image_path, thumb_path, lot_id FROM image_hashes").fetchall()
+        # 64비트 해시는 SQLite 정수 범위를 넘을 수 있어 16진수 문자열로 저장
+        return [{"hash": int(row["hash"], 16), "image_path": row["image_path"], "thumb_path": row["thumb_path"],
+                 "lot_id": row["lot_id"]} for row in rows]
+
+    def add_image_hash(self, image_hash, image_path, thumb_path, lot_id):
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT OR IGNORE INTO image_hashes (hash, image_path, thumb_path, lot_id, first_seen) VALUES (?, ?, ?, ?, ?)
+            """, (f"{image_hash:016x}", image_path, thumb_path, lot_id, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+_lot_store = None
+_lot_store_lock = threading.Lock()
+
+def get_lot_store():
+    global _lot_store
+    with _lot_store_lock:
+        if _lot_store is None:
+            _lot_store = LotStore(LOT_DB_PATH)
+        return _lot_store
+
+class CrawlJournal:
+    # 완료된 (검색 요청, 카테고리, 페이지) 단위와 추출 결과를 한 줄씩 덧붙이는 체크포인트 파일
+    def __init__(self, output_folder, brands, categories, site=DEFAULT_SITE):
+        signature = json.dumps(["v3", site, list(brands), list(categories)], ensure_ascii=False)
+        key = hashlib.sha1(signature.encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(output_folder, f"crawl_journal_{key}.jsonl")
+        self.units = {}
+        self.queries = None
+
+    def load(self):
+        items = []
+        if not os.path.exists(self.path):
+            return items
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 기록 도중 종료된 마지막 줄은 버림
+                    print("체크포인트 마지막 줄이 손상되어 건너뜁니다.")
+                    break
+                if "plan" in record:
+                    self.queries = record["plan"]
+                    continue
+                unit = self.units.setdefault((record["query"], record["category"]), {
+                    "total_pages": record["total_pages"], "pages": set(), "stopped": False
+                })
+                unit["pages"].add(record["page"])
+                unit["stopped"] = unit["stopped"] or record.get("stopped", False)
+                items.extend(Lot.from_dict(data) for data in record["items"])
+
+        print(f"체크포인트 불러옴: 검색 요청 {len(self.units)}개, 아이템 {len(items)}개")
+        return items
+
+    def reset(self):
+        self.units = {}
+        self.queries = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def total_pages(self, query_key, category):
+        unit = self.units.get((query_key, category))
+        return unit["total_pages"] if unit else None
+
+    def is_done(self, query_key, category, page):
+        unit = self.units.get((query_key, category))
+        if not unit:
+            return False
+        return unit["stopped"] or page in unit["pages"]
+
+    def append(self, record):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record_plan(self, queries):
+        # 검색 요청 키는 브랜드 ID 확인 결과에 따라 달라지므로, 이어하기 때는 처음 세운 계획을 그대로 씀
+        self.append({"plan": queries})
+        self.queries = queries
+
+    def record(self, query_key, category, page, total_pages, items, stopped=False):
+        self.append({
+            "query": query_key,
+            "category": category,
+            "page": page,
+            "total_pages": total_pages,
+            "stopped": stopped,
+            "items": [lot.to_dict() for lot in items]
+        })
+
+        unit = self.units.setdefault((query_key, category), {"total_pages": total_pages, "pages": set(), "stopped": False})
+        unit["pages"].add(page)
+        unit["stopped"] = unit["stopped"] or stopped
+
+    def finish(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        print("크롤링이 모두 완료되어 체크포인트를 삭제했습니다.")
+
+def normalize_brand(name):
+    # 전각 문자(＆ 등)와 대소문자, 공백 차이를 무시하고 비교
+    return " ".join(unicodedata.normalize("NFKC", name).upper().split())
+
+def parse_brand_ids(soup):
+    brand_ids = {}
+    for select in soup.find_all("select", attrs={"name": re.compile(r"^master_item_brands")}):
+        for option in select.find_all("option"):
+            if option.get("value") and option.text.strip():
+                brand_ids[normalize_brand(option.text)] = option["value"]
+
+    for box in soup.find_all("input", attrs={"name": re.compile(r"^master_item_brands"), "value": True}):
+        label = box.find_parent("label") or (box.get("id") and soup.find("label", attrs={"for": box["id"]}))
+        if label and label.text.strip() and box["value"]:
+            brand_ids[normalize_brand(label.text)] = box["value"]
+    return brand_ids
+
+def load_brand_ids(session, max_age_days=BRAND_IDS_MAX_AGE_DAYS):
+    # 사이트의 브랜드 필터 ID 목록 (파일에 캐시)
+    if os.path.exists(BRAND_IDS_PATH):
+        try:
+            with open(BRAND_IDS_PATH, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            # 깨진 캐시는 무시하고 다시 받아 덮어씀
+            print(f"브랜드 ID 캐시를 읽지 못해 무시합니다: {e}")
+            cached = {}
+        if not isinstance(cached, dict):
+            cached = {}
+        age = time.time() - cached.get("updated_at", 0)
+        if isinstance(cached.get("brand_ids"), dict) and cached["brand_ids"] and age < max_age_days * 86400:
+            return cached["brand_ids"]
+
+    try:
+        with crawl_metrics.stage("page_fetch"):
+            response = fetch(session, f"{ECOAUC_BASE_URL}/client/auctions/inspect", "inspect", params={"limit": "1"})
+        crawl_metrics.inc("page_fetch_bytes_total", len(response.content))
+        if response.status_code != 200:
+            # 재시도를 다 쓴 5xx 등은 fetch가 응답 그대로 돌려줌
+            print(f"브랜드 ID 목록을 가져오지 못했습니다: 상태 코드 {response.status_code}")
+            return {}
+        brand_ids = parse_brand_ids(BeautifulSoup(response.text, 'html.parser'))
+    except RequestException as e:
+        print(f"브랜드 ID 목록을 가져오지 못했습니다: {e}")
+        return {}
+
+    print(f"브랜드 ID {len(brand_ids)}개 확인")
+    if brand_ids:
+        os.makedirs(os.path.dirname(BRAND_IDS_PATH), exist_ok=True)
+        with open(BRAND_IDS_PATH, "w", encoding="utf-8") as f:
+            json.dump({"updated_at": time.time(), "brand_ids": brand_ids}, f, ensure_ascii=False)
+    return brand_ids
+
+def inspect_params(category):
+    return {
+        "limit": "500",
+        "sortKey": "1",
+        "tableType": "grid",
+        "q": "",
+        "low": "",
+        "high": "",
+        "master_item_brands": "",
+        "auction_lane_id": "",
+        "master_item_shapes": "",
+        "master_item_ranks": "",
+        "page": "1",
+        "master_item_categories[0]": category
+    }
 
+def plan_queries(brands, categories, brand_ids, batch_size=QUERY_BRAND_BATCH):
+    # 브랜드 필터로 여러 브랜드를 한 번에 조회하고, ID를 모르는 브랜드만 텍스트 검색
+    filtered = [brand for brand in brands if normalize_brand(brand) in brand_ids]
+    text_search = [brand for brand in brands if normalize_brand(brand) not in brand_ids]
+
+    queries = []
+    for category in categories:
+        for start in range(0, len(filtered), batch_size):
+            batch = filtered[start:start + batch_size]
+            params = inspect_params(category)
+            for i, brand in enumerate(batch):
+                params[f"master_item_brands[{i}]"] = brand_ids[normalize_brand(brand)]
+            queries.append({"key": "brands:" + "|".join(batch), "brands": batch, "category": category, "params": params})
+
+        for brand in text_search:
+            params = inspect_params(category)
+            params["q"] = brand
+            queries.append({"key": "q:" + brand, "brands": [brand], "category": category, "params": params})
+
+    print(f"검색 계획: 요청 {len(queries)}개 (브랜드 필터 {len(filtered)}개, 텍스트 검색 {len(text_search)}개)")
+    return queries
+
+def count_total_pages(soup):
     pagination = soup.find("ul", class_="pagination")
     if pagination:
         page_links = pagination.find_all("li")
@@ -101,197 +1370,1242 @@ def get_total_pages(session, base_url, params):
 
     return 0
 
-def create_output_folder(brand):
-    output_folder = os.path.join(os.path.expanduser("~"), "Desktop", "크롤링결과", brand)
-    os.makedirs(output_folder, exist_ok=True)
-    return output_folder
+def extract_lot(item, brand, category, translator, job=None):
+    title_elem = item.find("b")
+    title = title_elem.text.strip() if title_elem else "N/A"
+    title = translate_text(translator, title, job) if translator else title
 
-def download_image(image_url, save_dir):
-    try:
+    canopy = item.find("ul", class_="canopy canopy-3 text-default")
+    if canopy:
+        rank_elem = canopy.find_all("li")[0].find("big", class_="canopy-value")
+        rank = rank_elem.next_sibling.strip() if rank_elem else "N/A"
+
+        price_elem = canopy.find_all("li")[1].find("big", class_="canopy-value")
+        starting_price = price_elem.text.strip() if price_elem else "N/A"
+    else:
+        rank = "N/A"
+        starting_price = "N/A"
+
+    image_url = None
+    image_elem = item.find("div", class_="item-image item-image-min pc-image-area")
+    if image_elem and image_elem.find("img"):
+        image_url = image_elem.find("img")['src']
+
+    market_title_elem = item.find("span", class_="market-title")
+    if market_title_elem:
+        market_title_text = market_title_elem.text.strip()
+        auction_date = extract_date(market_title_text)
+        market_time = translate_text(translator, market_title_text, job) if translator else market_title_text
+    else:
+        auction_date = None
+        market_time = "N/A"
+
+    return Lot(extract_lot_id(item, image_url), brand, category, title, rank, starting_price,
+               image_url, None, market_time, auction_date)
+
+class RateLimiter:
+    # 같은 사이트로 가는 페이지 요청 사이 최소 간격 (동시에 도는 크롤링끼리도 공유)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self, interval, job=None):
+        with self.lock:
+            now = time.monotonic()
+            delay = max(0.0, self.next_time - now)
+            self.next_time = max(now, self.next_time) + interval
+        if delay:
+            if job:
+                job.sleep(delay)
+            else:
+                time.sleep(delay)
+
+class SiteAdapter(abc.ABC):
+    # 경매 사이트마다 다른 부분(로그인, 검색 계획, 페이지 수, 카드 추출, 이미지 URL)만 모은 인터페이스
+    # 요청/파싱/번역/다운로드/저장 파이프라인은 search_and_crawl이 공통으로 처리함
+    name = None
+    page_endpoint = "inspect"
+    image_workers = None  # 이미지 동시 다운로드 수 (None이면 ThreadPoolExecutor 기본값)
+    image_headers = None
+
+    def __init__(self):
+        self.rate_limiter = RateLimiter()
+
+    @property
+    def request_interval(self):
+        return PAGE_DELAY
+
+    @abc.abstractmethod
+    def login(self):
+        # 로그인된 requests 세션 (실패하면 None)
+        ...
+
+    @abc.abstractmethod
+    def plan_queries(self, session, brands, categories):
+        # 검색 요청 목록: {"key", "brands", "category", "params"} (JSON으로 저장 가능해야 함)
+        ...
+
+    @abc.abstractmethod
+    def fetch_page(self, session, query, page, job=None):
+        ...
+
+    @abc.abstractmethod
+    def count_total_pages(self, soup):
+        ...
+
+    @abc.abstractmethod
+    def find_cards(self, soup):
+        ...
+
+    @abc.abstractmethod
+    def match_brand(self, card, brand_lookup):
+        # 카드가 요청한 브랜드 중 하나면 그 브랜드 이름, 아니면 None
+        ...
+
+    @abc.abstractmethod
+    def extract_lot(self, card, brand, category, translator, job=None):
+        ...
+
+    def normalize_image_url(self, image_url):
+        return image_url
+
+    def thumbnail_url(self, image_url):
+        # 중복 사진 확인용 작은 이미지 (카드에 있는 이미지 URL이 보통 썸네일)
+        return image_url
+
+class EcoAucAdapter(SiteAdapter):
+    name = "ecoauc"
+
+    def login(self):
+        return login_and_check()
+
+    def plan_queries(self, session, brands, categories):
+        return plan_queries(brands, categories, load_brand_ids(session))
+
+    def fetch_page(self, session, query, page, job=None):
+        params = dict(query["params"])
+        params["page"] = str(page)
+        return fetch(session, f"{ECOAUC_BASE_URL}/client/auctions/inspect", self.page_endpoint, params=params, job=job)
+
+    def count_total_pages(self, soup):
+        return count_total_pages(soup)
+
+    def find_cards(self, soup):
+        return soup.find_all("div", class_="col-sm-6 col-md-4 col-lg-3 mb-grid-card")
+
+    def match_brand(self, card, brand_lookup):
+        # 카드의 브랜드 표기로 요청한 브랜드에 배정
+        brand_elem = card.find("small", class_="show-case-bland")
+        return brand_lookup.get(normalize_brand(brand_elem.text)) if brand_elem else None
+
+    def extract_lot(self, card, brand, category, translator, job=None):
+        return extract_lot(card, brand, category, translator, job)
+
+    def normalize_image_url(self, image_url):
+        # 썸네일 크기 파라미터(w, h)를 빼서 원본 이미지를 받음
         parsed_url = urllib.parse.urlparse(image_url)
         query_params = urllib.parse.parse_qs(parsed_url.query)
         query_params.pop('w', None)
         query_params.pop('h', None)
         new_query = urllib.parse.urlencode(query_params, doseq=True)
-        new_url = urllib.parse.urlunparse(parsed_url._replace(query=new_query))
+        return urllib.parse.urlunparse(parsed_url._replace(query=new_query))
+
+class PenguinAucAdapter(SiteAdapter):
+    # crawlers/penguinAuc.js의 로그인/선택자를 옮긴 것 (영문 페이지 기준)
+    name = "penguin"
+    image_workers = 3
+
+    @property
+    def request_interval(self):
+        return PENGUIN_PAGE_DELAY
+
+    @property
+    def image_headers(self):
+        return {"Referer": f"{PENGUIN_BASE_URL}/"}
+
+    def login(self):
+        session = requests.Session()
+        login_data = {"mail": PENGUIN_LOGIN_EMAIL, "password": PENGUIN_LOGIN_PASSWORD, "m": "login"}
+        headers = {"Referer": f"{PENGUIN_BASE_URL}/login/"}
+
+        print("펭귄옥션 로그인 시도 중...")
+        login_response = fetch(session, f"{PENGUIN_BASE_URL}/login/", "login", method="POST", data=login_data, headers=headers)
+        # 한 페이지 150개, 영문 페이지
+        session.cookies.set("search-recode", "150")
+        session.cookies.set("stt_lang", "en")
+
+        check_page = fetch(session, f"{PENGUIN_BASE_URL}/auction/", "login")
+        if login_response.status_code == 200 and check_page.status_code == 200:
+            print("펭귄옥션 로그인 성공!")
+            return session
+        print("펭귄옥션 로그인 실패.")
+        return None
 
-        response = requests.get(new_url, timeout=30)
-        if response.status_code == 200:
-            os.makedirs(save_dir, exist_ok=True)
-            file_name = os.path.join(save_dir, os.path.basename(new_url))
-            with open(file_name, 'wb') as f:
-                f.write(response.content)
-            return file_name
-    except Exception as e:
-        print(f"Error downloading image {image_url}: {e}")
-    return None
+    def plan_queries(self, session, brands, categories):
+        # 브랜드 필터가 없으므로 브랜드마다 키워드 검색
+        queries = []
+        for category in categories:
+            site_category = PENGUIN_CATEGORY_IDS.get(category)
+            if not site_category:
+                print(f"펭귄옥션에 없는 카테고리 {category}는 건너뜁니다.")
+                continue
+            for brand in brands:
+                params = {"category": site_category, "word": brand, "bid": "0", "my_bid": "0"}
+                queries.append({"key": "q:" + brand, "brands": [brand], "category": category, "params": params})
+        print(f"펭귄옥션 검색 계획: 요청 {len(queries)}개")
+        return queries
+
+    def fetch_page(self, session, query, page, job=None):
+        params = dict(query["params"])
+        if page > 1:
+            params["page"] = str(page)
+        return fetch(session, f"{PENGUIN_BASE_URL}/auction/", self.page_endpoint, params=params, job=job)
+
+    def count_total_pages(self, soup):
+        pager = soup.select_one(".pager-block ul.pager")
+        if not pager:
+            return 1
+        last_page = 1
+        for link in pager.select("li a"):
+            match = re.search(r"page=(\d+)", link.get("href", ""))
+            if match:
+                last_page = max(last_page, int(match.group(1)))
+        return last_page
+
+    def find_cards(self, soup):
+        return soup.select("ul.goods li")
+
+    def card_title(self, card):
+        link = card.select_one(".goods-ttl a")
+        # 앞쪽 괄호 표기 제거 (예: "[限定] CHANEL ..." → "CHANEL ...")
+        return re.sub(r"^[\[\(][^\]\)]*[\]\)]\s*", "", link.text.strip()) if link else ""
+
+    def match_brand(self, card, brand_lookup):
+        title = normalize_brand(self.card_title(card))
+        for key in sorted(brand_lookup, key=len, reverse=True):
+            if title.startswith(key):
+                return brand_lookup[key]
+        # 브랜드별 키워드 검색이므로 제목에 브랜드가 없어도 검색한 브랜드로 봄
+        return next(iter(brand_lookup.values())) if len(brand_lookup) == 1 else None
+
+    def extract_lot(self, card, brand, category, translator, job=None):
+        link = card.select_one(".goods-ttl a")
+        match = re.search(r"/detail/(\d+)/", link.get("href", "")) if link else None
+        if not match:
+            return None
+        title = self.card_title(card)
+        title = translate_text(translator, title, job, src="en") if translator else title
+
+        rank_elem = card.select_one(".goods-img .rank")
+        rank = "N/A"
+        if rank_elem:
+            rank_match = re.search(r"rank\s+(\w+)", " ".join(rank_elem.get("class", [])), re.I)
+            rank = rank_elem.text.strip().upper() or (rank_match.group(1).upper() if rank_match else "N/A")
+
+        image_elem = card.select_one(".goods-img img")
+        image_url = image_elem["src"] if image_elem and image_elem.get("src") else None
+
+        # 가격표: 1행 머리글, 2행 시작가, 3행 현재가 (현재가 우선)
+        starting_price = "N/A"
+        price_rows = card.select(".currency-tbl .tr")
+        for row in reversed(price_rows[1:3]):
+            cell = row.select_one(".td[data-stt-ignore]")
+            if cell and currency_to_int(cell.text):
+                starting_price = cell.text.strip()
+                break
+
+        schedule_elem = card.select_one(".countdown-time .text")
+        market_time = schedule_elem.text.strip() if schedule_elem else "N/A"
 
-def translate_text(translator, text):
+        return Lot(f"penguin-{match.group(1)}", brand, category, title, rank, starting_price,
+                   image_url, None, market_time, extract_month_day(market_time))
+
+    def normalize_image_url(self, image_url):
+        return image_url.split("?")[0]
+
+def extract_month_day(text, today=None):
+    # "2/5 14:00"처럼 연도 없는 일정: 이번 달보다 앞선 달이면 내년으로 봄
+    match = re.search(r"(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})", text or "")
+    if not match:
+        return None
+    month, day, hour, minute = (int(v) for v in match.groups())
+    today = today or datetime.date.today()
+    year = today.year + 1 if month < today.month else today.year
     try:
-        translated = translator.translate(text, src='ja', dest='ko')
-        return translated.text
-    except Exception as e:
-        print(f"Translation error: {e}")
-    return text
+        return datetime.datetime(year, month, day, hour, minute).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
 
-def search_and_crawl(session, brands, categories, output_folder, translator, progress_callback=None):
-    base_url = "https://www.ecoauc.com/client/auctions/inspect"
-    all_items = []
-    total_brands = len(brands)
-
-    for brand_index, brand in enumerate(brands):
-        params = {
-            "limit": "500",
-            "sortKey": "1",
-            "tableType": "grid",
-            "q": brand,
-            "low": "",
-            "high": "",
-            "master_item_brands": "",
-            "auction_lane_id": "",
-            "master_item_shapes": "",
-            "master_item_ranks": "",
-            "page": "1"
-        }
+SITE_ADAPTERS = {adapter.name: adapter for adapter in (EcoAucAdapter(), PenguinAucAdapter())}
+
+def image_dhash(image_bytes, hash_size=8):
+    # 차이 해시(dHash): 흑백 (hash_size+1)x hash_size로 줄인 뒤 옆 픽셀보다 밝은지로 64비트를 만듦
+    image = PILImage.open(io.BytesIO(image_bytes)).convert("L").resize((hash_size + 1, hash_size), PILImage.LANCZOS)
+    pixels = list(image.getdata())
+    value = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+class BKTree:
+    # 해밍 거리 기준 BK-트리. 거리 d 이내 검색 시 자식 중 |거리 - d| 범위만 내려감
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, key, value):
+        node = self.root
+        if node is None:
+            self.root = [key, value, {}]
+            self.size += 1
+            return
+        while True:
+            distance = hamming_distance(key, node[0])
+            if distance == 0:
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, value, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, key, max_distance):
+        results = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(key, node[0])
+            if distance <= max_distance:
+                results.append((distance, node[1]))
+            for child_distance, child in node[2].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return sorted(results, key=lambda result: result[0])
+
+class ImageIndex:
+    # 다운로드한 이미지의 dHash → 원본/썸네일 파일과 처음 본 경매품. 저장소에 남겨 크롤링 간에 재사용
+    def __init__(self, lot_store=None, max_distance=IMAGE_HASH_MAX_DISTANCE):
+        self.lot_store = lot_store
+        self.max_distance = max_distance
+        self.tree = BKTree()
+        self.lock = threading.Lock()
+        if lot_store:
+            for entry in lot_store.load_image_hashes():
+                self.tree.add(entry["hash"], entry)
+
+    def find(self, image_hash):
+        with self.lock:
+            matches = self.tree.search(image_hash, self.max_distance)
+        # 파일이 지워진 항목은 건너뜀
+        for distance, entry in matches:
+            if os.path.exists(entry["image_path"]):
+                return entry
+        return None
 
-        for i, category in enumerate(categories):
-            params[f"master_item_categories[{i}]"] = category
+    def add(self, image_hash, image_path, thumb_path, lot_id):
+        entry = {"hash": image_hash, "image_path": image_path, "thumb_path": thumb_path, "lot_id": lot_id}
+        with self.lock:
+            self.tree.add(image_hash, entry)
+        if self.lot_store:
+            self.lot_store.add_image_hash(image_hash, image_path, thumb_path, lot_id)
+        return entry
 
-        total_pages = get_total_pages(session, base_url, params)
-        print(f"Total pages for {brand}: {total_pages}")
+_image_indexes = {}
+_image_indexes_lock = threading.Lock()
 
-        image_urls = []
-        for page in range(1, total_pages + 1):
-            print(f"Crawling page {page} for {brand}...")
-            params["page"] = str(page)
-            response = session.get(base_url, params=params)
-            soup = BeautifulSoup(response.text, 'html.parser')
+def get_image_index(lot_store=None):
+    # 저장소(DB 파일)마다 색인 하나를 공유. 저장소가 없으면 이번 크롤링 안에서만 씀
+    if PILImage is None:
+        return None
+    if lot_store is None:
+        return ImageIndex()
+    with _image_indexes_lock:
+        if lot_store.db_path not in _image_indexes:
+            _image_indexes[lot_store.db_path] = ImageIndex(lot_store)
+        return _image_indexes[lot_store.db_path]
+
+def link_or_copy(source, target):
+    # 같은 사진이면 다시 받지 않고 기존 파일을 하드링크(안 되면 복사)해서 씀
+    if os.path.exists(target) or os.path.abspath(source) == os.path.abspath(target):
+        return target
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+    return target
+
+def save_thumbnail(image_bytes, thumb_path):
+    image = PILImage.open(io.BytesIO(image_bytes)).convert("RGB")
+    image.thumbnail((IMAGE_THUMBNAIL_SIZE, IMAGE_THUMBNAIL_SIZE))
+    os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+    image.save(thumb_path, "JPEG", quality=85)
+    return thumb_path
+
+def download_lot_image(lot, save_dir, job=None, adapter=None, image_index=None):
+    # 카드 썸네일로 dHash를 먼저 구해, 이미 받은 사진과 같으면 원본을 다시 받지 않고 재등록으로 표시
+    adapter = adapter or SITE_ADAPTERS[DEFAULT_SITE]
+    if image_index is None:
+        image_path = download_image(lot.image_url, save_dir, job, adapter)
+        if image_path:
+            lot.image = os.path.basename(image_path)
+        return
 
-            items = soup.find_all("div", class_="col-sm-6 col-md-4 col-lg-3 mb-grid-card")
+    # 이어서 크롤링할 때 이미 받은 이미지는 다시 확인하지 않음
+    file_name = os.path.join(save_dir, os.path.basename(urllib.parse.urlparse(lot.image_url).path))
+    if os.path.exists(file_name):
+        lot.image = os.path.basename(file_name)
+        return
 
-            if not items:
-                print(f"No items found on page {page} for {brand}. Stopping crawl.")
-                break
+    if job:
+        job.checkpoint()
+    try:
+        response = fetch(None, adapter.thumbnail_url(lot.image_url), "image", job=job, headers=adapter.image_headers)
+        if response.status_code != 200:
+            raise OSError(f"thumbnail status {response.status_code}")
+        crawl_metrics.inc("image_download_bytes_total", len(response.content))
+        image_hash = image_dhash(response.content)
+    except (RequestException, OSError) as e:
+        print(f"썸네일 해시 실패, 원본만 받습니다 ({lot.image_url}): {e}")
+        image_path = download_image(lot.image_url, save_dir, job, adapter)
+        if image_path:
+            lot.image = os.path.basename(image_path)
+        return
 
-            print(f"Found {len(items)} items on page {page}")
+    # 단색 자리표시 이미지는 모두 같은 해시가 되므로 재출품으로 보지 않음
+    distinctive = IMAGE_HASH_MIN_BITS <= bin(image_hash).count("1") <= 64 - IMAGE_HASH_MIN_BITS
+    match = image_index.find(image_hash) if distinctive else None
+    if match:
+        image_path = link_or_copy(match["image_path"], os.path.join(save_dir, os.path.basename(match["image_path"])))
+        if match["thumb_path"] and os.path.exists(match["thumb_path"]):
+            link_or_copy(match["thumb_path"], os.path.join(save_dir, "thumbs", os.path.basename(match["thumb_path"])))
+        lot.image = os.path.basename(image_path)
+        if match["lot_id"] != lot.id:
+            lot.relist_of = match["lot_id"]
+            crawl_metrics.inc("relists_total")
+        crawl_metrics.inc("image_dedup_hits_total")
+        return
 
-            for idx, item in enumerate(items, 1):
-                try:
-                    brand_elem = item.find("small", class_="show-case-bland")
-                    brand_text = brand_elem.text.strip() if brand_elem else "N/A"
-                    if brand_text != brand:
-                        continue
-
-                    title_elem = item.find("b")
-                    title = title_elem.text.strip() if title_elem else "N/A"
-                    title = translate_text(translator, title) if translator else title
-
-                    canopy = item.find("ul", class_="canopy canopy-3 text-default")
-                    if canopy:
-                        rank_elem = canopy.find_all("li")[0].find("big", class_="canopy-value")
-                        rank = rank_elem.next_sibling.strip() if rank_elem else "N/A"
-
-                        price_elem = canopy.find_all("li")[1].find("big", class_="canopy-value")
-                        starting_price = price_elem.text.strip() if price_elem else "N/A"
-                    else:
-                        rank = "N/A"
-                        starting_price = "N/A"
-
-                    image_elem = item.find("div", class_="item-image item-image-min pc-image-area")
-                    if image_elem and image_elem.find("img"):
-                        image_url = image_elem.find("img")['src']
-                        image_urls.append(image_url)
-
-                    market_title_elem = item.find("span", class_="market-title")
-                    if market_title_elem:
-                        market_title_text = market_title_elem.text.strip()
-                        market_time = market_title_text
-                        market_time = translate_text(translator, market_time) if translator else market_time
-                    else:
-                        market_time = "N/A"
-
-                    all_items.append({
-                        "Brand": brand,
-                        "Title": title,
-                        "Rank": rank,
-                        "Starting Price": starting_price,
-                        "Image": None,
-                        "Time": market_time
-                    })
-
-                    if progress_callback:
-                        progress_callback(brand, page, total_pages, len(all_items), idx)
-
-                    if idx % 10 == 0:
-                        print(f"Processed {idx}/{len(items)} items on page {page}")
-                except Exception as e:
-                    print(f"Error processing item {idx} on page {page}: {e}")
-                    print(f"Item HTML: {item}")
+    image_path = download_image(lot.image_url, save_dir, job, adapter)
+    if not image_path:
+        return
+    lot.image = os.path.basename(image_path)
+    thumb_path = save_thumbnail(response.content, os.path.join(save_dir, "thumbs", lot.image))
+    if distinctive:
+        image_index.add(image_hash, os.path.abspath(image_path), os.path.abspath(thumb_path), lot.id)
+
+def crawl_page(session, adapter, query, page, translator, job=None, progress_callback=None, total_pages=None, done_count=0):
+    # 검색 결과 한 페이지를 받아 경매품으로 추출. (경매품, 전체 페이지 수, 카드 수)를 돌려주고 카드가 없으면 카드 수 0
+    query_key = query["key"]
+    category = query["category"]
+    brand_lookup = {normalize_brand(brand): brand for brand in query["brands"]}
+
+    # 같은 사이트로 가는 요청 간격 (다른 크롤링과 공유)
+    adapter.rate_limiter.wait(adapter.request_interval, job)
+
+    print(f"[{adapter.name}] Crawling page {page} for {query_key} (category {category})...")
+    with crawl_metrics.stage("page_fetch"):
+        response = adapter.fetch_page(session, query, page, job)
+    page_bytes = len(response.content)
+    crawl_metrics.inc("page_fetch_bytes_total", page_bytes)
+    crawl_metrics.inc("pages_total")
+
+    with crawl_metrics.stage("parse"):
+        soup = BeautifulSoup(response.text, 'html.parser')
+        items = adapter.find_cards(soup)
+
+    if total_pages is None:
+        # 첫 페이지 응답에서 전체 페이지 수를 읽어 요청 하나를 줄임
+        total_pages = adapter.count_total_pages(soup)
+        print(f"Total pages for {query_key} (category {category}): {total_pages}")
+
+    if not items:
+        print(f"No items found on page {page} for {query_key}. Stopping crawl.")
+        return [], total_pages, 0, page_bytes
+
+    print(f"Found {len(items)} items on page {page}")
+
+    page_items = []
+    for idx, item in enumerate(items, 1):
+        try:
+            brand = adapter.match_brand(item, brand_lookup)
+            if not brand:
+                continue
+
+            lot = adapter.extract_lot(item, brand, category, translator, job)
+            if not lot:
+                continue
+            page_items.append(lot)
+
+            if progress_callback:
+                progress_callback(brand, page, total_pages, done_count + len(page_items), idx)
+
+            if idx % 10 == 0:
+                print(f"Processed {idx}/{len(items)} items on page {page}")
+        except Exception as e:
+            print(f"Error processing item {idx} on page {page}: {e}")
+            print(f"Item HTML: {item}")
+
+    crawl_metrics.inc("items_total", len(page_items))
+    crawl_metrics.inc("cards_skipped_total", len(items) - len(page_items))
+    return page_items, total_pages, len(items), page_bytes
+
+def download_lot_images(items, output_folder, job=None, adapter=None, lot_store=None):
+    # 같은 사진(재출품)은 이미 받은 파일을 재사용하고 lot.relist_of에 먼저 본 경매품을 기록
+    adapter = adapter or SITE_ADAPTERS[DEFAULT_SITE]
+    image_index = get_image_index(lot_store)
+    executor = ThreadPoolExecutor(max_workers=adapter.image_workers)
+    try:
+        futures = []
+        for lot in items:
+            if lot.image_url:
+                futures.append(executor.submit(download_lot_image, lot, os.path.join(output_folder, 'images'), job, adapter, image_index))
+
+        crawl_metrics.set_gauge("image_queue_depth", len(futures))
+        for future in futures:
+            future.result()
+            crawl_metrics.set_gauge("image_queue_depth", sum(1 for f in futures if not f.done()))
+    finally:
+        # 취소되면 아직 시작하지 않은 다운로드는 버리고 진행 중인 것만 마무리
+        executor.shutdown(wait=True, cancel_futures=True)
+        crawl_metrics.set_gauge("image_queue_depth", 0)
+
+    if lot_store:
+        lot_store.upsert_lots([lot for lot in items if lot.image])
+
+def search_and_crawl(session, brands, categories, output_folder, translator, progress_callback=None, lot_store=None, resume=False, items_callback=None, job=None, adapter=None):
+    adapter = adapter or SITE_ADAPTERS[DEFAULT_SITE]
+    all_items = []
+    metrics_mark = crawl_metrics.mark()
+    # 이번 호출에서 실제로 받은 페이지만 (이어하기로 불러온 경매품은 제외)
+    fetched_bytes = 0
+    fetched_items = 0
+
+    journal = CrawlJournal(output_folder, brands, categories, adapter.name)
+    if resume:
+        all_items = journal.load()
+        if items_callback and all_items:
+            items_callback(list(all_items))
+    else:
+        journal.reset()
+
+    queries = journal.queries
+    if queries is None:
+        queries = adapter.plan_queries(session, brands, categories)
+        journal.record_plan(queries)
+    else:
+        print(f"체크포인트의 검색 계획을 그대로 사용: 요청 {len(queries)}개")
+
+    for query in queries:
+        query_key = query["key"]
+        category = query["category"]
+
+        total_pages = journal.total_pages(query_key, category)
+        page = 1
+        while total_pages is None or page <= total_pages:
+            # 취소되면 여기서 멈추고, 완료된 페이지는 체크포인트에 남아 이어하기로 재개 가능
+            if job:
+                job.checkpoint()
+            if journal.is_done(query_key, category, page):
+                print(f"Page {page} for {query_key} already crawled. Skipping.")
+                page += 1
+                continue
+
+            page_items, total_pages, card_count, page_bytes = crawl_page(session, adapter, query, page, translator, job,
+                                                                         progress_callback, total_pages, len(all_items))
+            fetched_bytes += page_bytes
+            fetched_items += len(page_items)
+            if not card_count:
+                journal.record(query_key, category, page, total_pages, [], stopped=True)
+                break
+
+            all_items.extend(page_items)
+            journal.record(query_key, category, page, total_pages, page_items)
+            if lot_store:
+                lot_store.upsert_lots(page_items)
+            if items_callback and page_items:
+                items_callback(page_items)
 
             print(f"Page {page} crawled successfully.")
-            time.sleep(1)
+            page += 1
 
     print(f"Crawling completed. Total items found: {len(all_items)}")
 
-    # 이미지 다운로드
-    with ThreadPoolExecutor() as executor:
-        futures = []
-        for image_url in image_urls:
-            futures.append(executor.submit(download_image, image_url, os.path.join(output_folder, 'images')))
+    # 이미지 다운로드 (경매품마다 자기 이미지 URL로 매칭)
+    download_lot_images(all_items, output_folder, job, adapter, lot_store)
 
-        for future in futures:
-            image_path = future.result()
-            if image_path:
-                for item in all_items:
-                    if item["Image"] is None:
-                        item["Image"] = os.path.basename(image_path)
-                        break
+    journal.finish()
+    crawl_metrics.log_event("crawl_finished", site=adapter.name, brands=brands, categories=categories, items=len(all_items),
+                            bytes_per_item=round(fetched_bytes / fetched_items) if fetched_items else None,
+                            metrics=crawl_metrics.since(metrics_mark))
+    return all_items
+
+def crawl_sites(sites, brands, categories, output_folder, translator, progress_callback=None, lot_store=None, resume=False, items_callback=None, job=None, sessions=None):
+    # 사이트마다 로그인 후 같은 파이프라인을 병렬로 실행 (요청 간격은 사이트별 RateLimiter가 지킴)
+    sessions = dict(sessions or {})
 
+    def crawl_site(site):
+        # 한 사이트가 실패해도 다른 사이트 결과는 살림 (취소만 그대로 전달)
+        adapter = SITE_ADAPTERS[site]
+        try:
+            session = sessions.get(site) or adapter.login()
+            if not session:
+                print(f"{site}: 로그인 실패, 건너뜁니다.")
+                return []
+            with crawl_metrics.stage(f"site_{site}"):
+                return search_and_crawl(session, brands, categories, output_folder, translator, progress_callback,
+                                        lot_store, resume, items_callback, job, adapter)
+        except CrawlCancelled:
+            raise
+        except Exception as e:
+            print(f"{site}: 크롤링 실패, 이 사이트 결과는 건너뜁니다: {e}")
+            crawl_metrics.inc(f"site_{site}_failures_total")
+            return []
+
+    all_items = []
+    with ThreadPoolExecutor(max_workers=len(sites) or 1) as executor:
+        for site, items in zip(sites, executor.map(crawl_site, sites)):
+            crawl_metrics.inc(f"site_{site}_items_total", len(items))
+            all_items.extend(items)
+    return all_items
+
+class TaskQueue:
+    # 분산 크롤링용 작업 큐 (SQLite). 작업 하나 = (사이트, 검색 요청, 카테고리, 페이지)
+    # 작업자는 작업을 일정 시간 임대(lease)하고, 끝내지 못한 채 죽으면 임대가 만료되어 다른 작업자가 다시 가져감
+    # WAL 모드는 네트워크 파일 시스템에서 동작하지 않으므로 파일은 코디네이터 컴퓨터에만 두고,
+    # 다른 컴퓨터의 작업자는 coordinator --serve로 연 HTTP 주소(RemoteTaskQueue)로 접속
+    def __init__(self, db_path=TASK_QUEUE_PATH, lease_seconds=TASK_LEASE_SECONDS, max_attempts=TASK_MAX_ATTEMPTS):
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        # 여러 프로세스가 같은 파일을 쓰므로 트랜잭션은 BEGIN IMMEDIATE로 직접 잡음
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def create_tables(self):
+        with self.lock:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS crawl_tasks (
+                    task_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    crawl_id TEXT NOT NULL,
+                    site TEXT NOT NULL,
+                    query_key TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    query TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker_id TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    total_pages INTEGER,
+                    result TEXT,
+                    error TEXT,
+                    UNIQUE (crawl_id, site, query_key, category, page)
+                );
+                CREATE INDEX IF NOT EXISTS idx_crawl_tasks_status ON crawl_tasks (status, lease_expires);
+            """)
+
+    def insert_pages(self, conn, crawl_id, site, query, pages):
+        # 같은 크롤링을 다시 계획해도 이미 있는 작업은 그대로 둠 (이어하기)
+        conn.executemany("""
+            INSERT OR IGNORE INTO crawl_tasks (crawl_id, site, query_key, category, page, query) VALUES (?, ?, ?, ?, ?, ?)
+        """, [(crawl_id, site, query["key"], query["category"], page, json.dumps(query, ensure_ascii=False)) for page in pages])
+
+    def enqueue(self, crawl_id, site, queries):
+        # 전체 페이지 수는 첫 페이지를 받아야 알 수 있으므로 검색 요청마다 1페이지만 넣음
+        with self.transaction() as conn:
+            for query in queries:
+                self.insert_pages(conn, crawl_id, site, query, [1])
+
+    def lease(self, worker_id, sites=None, crawl_id=None):
+        now = time.time()
+        with self.transaction() as conn:
+            # 재시도 횟수를 다 쓴 채 임대가 만료된 작업은 실패로 정리
+            conn.execute("""
+                UPDATE crawl_tasks SET status = 'failed', error = COALESCE(error, 'lease expired')
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """, (now, self.max_attempts))
+            sql = "SELECT * FROM crawl_tasks WHERE (status = 'pending' OR (status = 'leased' AND lease_expires < ?))"
+            params = [now]
+            if crawl_id:
+                sql += " AND crawl_id = ?"
+                params.append(crawl_id)
+            if sites:
+                sql += " AND site IN (" + ", ".join("?" * len(sites)) + ")"
+                params += list(sites)
+            row = conn.execute(sql + " ORDER BY task_id LIMIT 1", params).fetchone()
+            if not row:
+                return None
+            conn.execute("""
+                UPDATE crawl_tasks SET status = 'leased', worker_id = ?, lease_expires = ?, attempts = attempts + 1
+                WHERE task_id = ?
+            """, (worker_id, now + self.lease_seconds, row["task_id"]))
+
+        task = dict(row)
+        task["query"] = json.loads(task["query"])
+        task["attempts"] += 1
+        return task
+
+    def renew(self, task, worker_id):
+        with self.transaction() as conn:
+            return conn.execute("""
+                UPDATE crawl_tasks SET lease_expires = ? WHERE task_id = ? AND status = 'leased' AND worker_id = ?
+            """, (time.time() + self.lease_seconds, task["task_id"], worker_id)).rowcount == 1
+
+    def complete(self, task, worker_id, items, total_pages):
+        # 임대가 만료되어 다른 작업자에게 넘어간 작업이면 결과를 버리고 False
+        with self.transaction() as conn:
+            updated = conn.execute("""
+                UPDATE crawl_tasks SET status = 'done', total_pages = ?, result = ?, error = NULL, lease_expires = NULL
+                WHERE task_id = ? AND status = 'leased' AND worker_id = ?
+            """, (total_pages, json.dumps([lot.to_dict() for lot in items], ensure_ascii=False),
+                  task["task_id"], worker_id)).rowcount
+            if updated and task["page"] == 1 and total_pages and total_pages > 1:
+                # 첫 페이지에서 전체 페이지 수를 알았으니 나머지 페이지를 작업으로 추가
+                self.insert_pages(conn, task["crawl_id"], task["site"], task["query"], range(2, total_pages + 1))
+        return bool(updated)
+
+    def fail(self, task, worker_id, error):
+        with self.transaction() as conn:
+            conn.execute("""
+                UPDATE crawl_tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    error = ?, worker_id = NULL, lease_expires = NULL
+                WHERE task_id = ? AND status = 'leased' AND worker_id = ?
+            """, (self.max_attempts, str(error), task["task_id"], worker_id))
+
+    def release(self, task, worker_id):
+        # 작업자가 취소로 멈출 때는 시도 횟수를 돌려놓고 대기열로 되돌림
+        with self.transaction() as conn:
+            conn.execute("""
+                UPDATE crawl_tasks SET status = 'pending', attempts = attempts - 1, worker_id = NULL, lease_expires = NULL
+                WHERE task_id = ? AND status = 'leased' AND worker_id = ?
+            """, (task["task_id"], worker_id))
+
+    def progress(self, crawl_id=None):
+        sql = "SELECT status, COUNT(*) AS count FROM crawl_tasks"
+        params = []
+        if crawl_id:
+            sql += " WHERE crawl_id = ?"
+            params.append(crawl_id)
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        with self.lock:
+            for row in self.conn.execute(sql + " GROUP BY status", params):
+                counts[row["status"]] = row["count"]
+        return counts
+
+    def results(self, crawl_id):
+        # 사이트별 경매품 (검색 요청/카테고리/페이지 순)
+        with self.lock:
+            rows = self.conn.execute("""
+                SELECT site, result FROM crawl_tasks WHERE crawl_id = ? AND status = 'done'
+                ORDER BY site, query_key, category, page
+            """, (crawl_id,)).fetchall()
+        results = {}
+        for row in rows:
+            results.setdefault(row["site"], []).extend(Lot.from_dict(data) for data in json.loads(row["result"]))
+        return results
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class TaskQueueHandler(http.server.BaseHTTPRequestHandler):
+    # 다른 컴퓨터의 작업자용. POST /<메서드>로 받은 JSON 인자를 코디네이터의 TaskQueue에 그대로 넘김
+    methods = ("lease", "renew", "complete", "fail", "release", "progress")
+
+    def authorized(self):
+        if self.server.token and self.headers.get("X-Queue-Token") != self.server.token:
+            self.send_error(403)
+            return False
+        return True
+
+    def send_json(self, data, status=200):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/info":
+            self.send_error(404)
+            return
+        if self.authorized():
+            self.send_json({"lease_seconds": self.server.task_queue.lease_seconds})
+
+    def do_POST(self):
+        name = self.path.strip("/")
+        if name not in self.methods:
+            self.send_error(404)
+            return
+        if not self.authorized():
+            return
+        try:
+            args = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if name == "complete":
+                args["items"] = [Lot.from_dict(data) for data in args["items"]]
+            result = getattr(self.server.task_queue, name)(**args)
+        except Exception as e:
+            print(f"작업 큐 요청 처리 실패 ({name}): {e}")
+            self.send_json({"error": str(e)}, status=500)
+            return
+        self.send_json({"result": result})
+
+    def log_message(self, format, *args):
+        pass
+
+def start_task_queue_server(task_queue, host, port, token=TASK_QUEUE_TOKEN):
+    server = http.server.ThreadingHTTPServer((host, port), TaskQueueHandler)
+    server.task_queue = task_queue
+    server.token = token
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    if not token and host not in ("127.0.0.1", "localhost"):
+        print("경고: 토큰 없이 작업 큐를 외부에 열었습니다 (--token 또는 CRAWLER_QUEUE_TOKEN 권장)")
+    print(f"작업 큐 엔드포인트: http://{host}:{server.server_address[1]}")
+    return server
+
+class RemoteTaskQueue:
+    # coordinator --serve로 열린 작업 큐를 HTTP로 쓰는 작업자용 (TaskQueue와 같은 메서드)
+    def __init__(self, url, token=TASK_QUEUE_TOKEN):
+        self.url = url.rstrip("/")
+        self.session = requests.Session()
+        if token:
+            self.session.headers["X-Queue-Token"] = token
+        self.lease_seconds = self.call("info", method="GET")["lease_seconds"]
+
+    def call(self, name, method="POST", **args):
+        response = fetch(self.session, f"{self.url}/{name}", "queue", method=method,
+                         json=args if method == "POST" else None)
+        if response.status_code != 200:
+            raise RequestException(f"작업 큐 {name} 요청 실패: 상태 코드 {response.status_code} {response.text[:200]}")
+        return response.json()
+
+    def lease(self, worker_id, sites=None, crawl_id=None):
+        return self.call("lease", worker_id=worker_id, sites=list(sites) if sites else None, crawl_id=crawl_id)["result"]
+
+    def renew(self, task, worker_id):
+        return self.call("renew", task=task, worker_id=worker_id)["result"]
+
+    def complete(self, task, worker_id, items, total_pages):
+        return self.call("complete", task=task, worker_id=worker_id, items=[lot.to_dict() for lot in items],
+                         total_pages=total_pages)["result"]
+
+    def fail(self, task, worker_id, error):
+        return self.call("fail", task=task, worker_id=worker_id, error=str(error))["result"]
+
+    def release(self, task, worker_id):
+        return self.call("release", task=task, worker_id=worker_id)["result"]
+
+    def progress(self, crawl_id=None):
+        return self.call("progress", crawl_id=crawl_id)["result"]
+
+    def close(self):
+        self.session.close()
+
+def start_local_workers(queue_path, count, lease_seconds=TASK_LEASE_SECONDS, crawl_id=None):
+    # 한 컴퓨터에서 시험할 때 쓰는 작업자 프로세스. 이번 크롤링 작업만 처리하고 할 일이 없어지면 스스로 종료
+    crawl_args = ["--crawl-id", crawl_id] if crawl_id else []
+    return [subprocess.Popen([sys.executable, os.path.abspath(__file__), "worker", "--queue", queue_path,
+                              "--lease", str(lease_seconds), "--exit-when-idle", *crawl_args,
+                              "--worker-id", f"{socket.gethostname()}-local-{index}"])
+            for index in range(count)]
+
+def run_coordinator(task_queue, sites, brands, categories, output_folder, crawl_id=None, local_workers=0,
+                    poll_interval=TASK_POLL_INTERVAL, lot_store=None, job=None):
+    # 검색 계획만 세워 작업 큐에 넣고, 작업자들이 올린 결과를 모아 이미지 다운로드/저장을 처리
+    crawl_id = crawl_id or time.strftime("%Y%m%d-%H%M%S")
+    metrics_mark = crawl_metrics.mark()
+    for site in sites:
+        adapter = SITE_ADAPTERS[site]
+        session = adapter.login()
+        if not session:
+            print(f"{site}: 로그인 실패, 건너뜁니다.")
+            continue
+        task_queue.enqueue(crawl_id, site, adapter.plan_queries(session, brands, categories))
+
+    workers = start_local_workers(task_queue.db_path, local_workers, task_queue.lease_seconds, crawl_id)
+    try:
+        while True:
+            if job:
+                job.checkpoint()
+            counts = task_queue.progress(crawl_id)
+            for status, count in counts.items():
+                crawl_metrics.set_gauge(f"tasks_{status}", count)
+            print(f"[{crawl_id}] 완료 {counts['done']}, 진행 중 {counts['leased']}, 대기 {counts['pending']}, 실패 {counts['failed']}")
+            if not counts["pending"] and not counts["leased"]:
+                break
+            (job.sleep if job else time.sleep)(poll_interval)
+    except BaseException:
+        for worker in workers:
+            worker.terminate()
+        raise
+    finally:
+        for worker in workers:
+            worker.wait()
+
+    all_items = []
+    for site, items in task_queue.results(crawl_id).items():
+        if lot_store:
+            lot_store.upsert_lots(items)
+        download_lot_images(items, output_folder, job, SITE_ADAPTERS[site], lot_store)
+        crawl_metrics.inc(f"site_{site}_items_total", len(items))
+        all_items.extend(items)
+
+    crawl_metrics.log_event("distributed_crawl_finished", crawl_id=crawl_id, sites=sites, brands=brands, categories=categories,
+                            items=len(all_items), failed_tasks=counts["failed"], metrics=crawl_metrics.since(metrics_mark))
+    print(f"분산 크롤링 완료 ({crawl_id}): {len(all_items)}건, 실패한 작업 {counts['failed']}개")
     return all_items
 
+@contextlib.contextmanager
+def lease_renewal(task_queue, task, worker_id):
+    # 작업을 쥐고 있는 동안 별도 스레드가 임대를 주기적으로 연장
+    # (로그인, 재시도/백오프, 요청 간격/회로 차단 대기로 한 페이지가 임대 시간보다 오래 걸릴 수 있음)
+    stop = threading.Event()
+
+    def renew():
+        while not stop.wait(task_queue.lease_seconds / 3):
+            try:
+                if not task_queue.renew(task, worker_id):
+                    print(f"[{worker_id}] 임대를 잃어 연장을 멈춥니다 ({task['query_key']} 페이지 {task['page']})")
+                    return
+            except Exception as e:
+                print(f"[{worker_id}] 임대 연장 실패: {e}")
+
+    renewer = threading.Thread(target=renew, daemon=True)
+    renewer.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        renewer.join()
+
+def run_worker(task_queue, worker_id=None, sites=None, exit_when_idle=False, poll_interval=TASK_POLL_INTERVAL, job=None,
+               crawl_id=None):
+    # 큐에서 페이지 작업을 하나씩 임대해 받아오기/추출만 하고 결과(경매품)를 큐에 돌려줌
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    translator = make_translator()
+    sessions = {}
+    completed = 0
+    while True:
+        if job:
+            job.checkpoint()
+        task = task_queue.lease(worker_id, sites, crawl_id)
+        if not task:
+            counts = task_queue.progress(crawl_id)
+            if exit_when_idle and not counts["pending"] and not counts["leased"]:
+                break
+            (job.sleep if job else time.sleep)(poll_interval)
+            continue
+
+        adapter = SITE_ADAPTERS[task["site"]]
+        try:
+            with lease_renewal(task_queue, task, worker_id):
+                session = sessions.get(task["site"]) or adapter.login()
+                if not session:
+                    raise RuntimeError(f"{task['site']} 로그인 실패")
+                sessions[task["site"]] = session
+                items, total_pages, _, _ = crawl_page(session, adapter, task["query"], task["page"], translator, job)
+        except (CrawlCancelled, KeyboardInterrupt):
+            # Ctrl+C로 멈춘 경우도 임대 만료를 기다리지 않고 바로 다른 작업자에게 넘김
+            task_queue.release(task, worker_id)
+            raise
+        except Exception as e:
+            print(f"[{worker_id}] 작업 실패 ({task['site']} {task['query_key']} 페이지 {task['page']}, {task['attempts']}번째 시도): {e}")
+            crawl_metrics.inc("tasks_failed_total")
+            task_queue.fail(task, worker_id, e)
+            continue
+
+        if task_queue.complete(task, worker_id, items, total_pages):
+            completed += 1
+            crawl_metrics.inc("tasks_completed_total")
+        else:
+            print(f"[{worker_id}] 임대가 만료되어 결과를 버렸습니다 ({task['query_key']} 페이지 {task['page']})")
+    print(f"[{worker_id}] 작업 {completed}개 완료, 종료합니다.")
+    return completed
+
+def main_distributed(argv):
+    parser = argparse.ArgumentParser(prog=os.path.basename(__file__), description="분산 크롤링 (coordinator / worker)")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    coordinator = subparsers.add_parser("coordinator", help="검색 계획을 작업 큐에 넣고 결과를 모아 저장")
+    coordinator.add_argument("--queue", default=TASK_QUEUE_PATH, help="작업 큐 SQLite 파일 (이 컴퓨터에만 둠)")
+    coordinator.add_argument("--serve", metavar="HOST:PORT", help="다른 컴퓨터의 작업자가 접속할 작업 큐 HTTP 주소 (예: 0.0.0.0:8765)")
+    coordinator.add_argument("--token", default=TASK_QUEUE_TOKEN, help="--serve 접속 토큰 (기본: CRAWLER_QUEUE_TOKEN)")
+    coordinator.add_argument("--sites", nargs="+", choices=sorted(SITE_ADAPTERS), default=[DEFAULT_SITE])
+    coordinator.add_argument("--brands", nargs="+", default=BRANDS)
+    coordinator.add_argument("--categories", nargs="+", required=True, help="카테고리 ID (예: 1 2)")
+    coordinator.add_argument("--output", default=os.path.join(RESULT_ROOT, "distributed"))
+    coordinator.add_argument("--crawl-id", help="같은 ID로 다시 실행하면 남은 작업만 이어서 처리")
+    coordinator.add_argument("--local-workers", type=int, default=0, help="이 컴퓨터에서 함께 띄울 작업자 수")
+    coordinator.add_argument("--lease", type=float, default=TASK_LEASE_SECONDS)
+    coordinator.add_argument("--excel-profile", choices=list(EXCEL_PROFILES), default=DEFAULT_EXCEL_PROFILE)
+    coordinator.add_argument("--image-archive", action="store_true", help="엑셀 옆에 이미지 압축 파일도 저장")
+
+    worker = subparsers.add_parser("worker", help="작업 큐에서 페이지 작업을 가져와 처리")
+    worker.add_argument("--queue", default=TASK_QUEUE_PATH,
+                        help="같은 컴퓨터면 SQLite 파일, 다른 컴퓨터면 coordinator --serve 주소 (http://HOST:PORT)")
+    worker.add_argument("--token", default=TASK_QUEUE_TOKEN, help="--serve 접속 토큰 (기본: CRAWLER_QUEUE_TOKEN)")
+    worker.add_argument("--sites", nargs="+", choices=sorted(SITE_ADAPTERS), help="처리할 사이트 (기본: 전부)")
+    worker.add_argument("--worker-id")
+    worker.add_argument("--lease", type=float, default=TASK_LEASE_SECONDS)
+    worker.add_argument("--exit-when-idle", action="store_true", help="남은 작업이 없으면 종료")
+    worker.add_argument("--crawl-id", help="이 크롤링 ID의 작업만 처리 (기본: 전부)")
+
+    args = parser.parse_args(argv)
+    if args.mode == "worker" and args.queue.startswith(("http://", "https://")):
+        task_queue = RemoteTaskQueue(args.queue, args.token)
+    else:
+        task_queue = TaskQueue(args.queue, lease_seconds=args.lease)
+    try:
+        if args.mode == "worker":
+            run_worker(task_queue, args.worker_id, args.sites, args.exit_when_idle, crawl_id=args.crawl_id)
+            return 0
+        if args.serve:
+            host, _, port = args.serve.rpartition(":")
+            start_task_queue_server(task_queue, host or "0.0.0.0", int(port), args.token)
+        os.makedirs(args.output, exist_ok=True)
+        items = run_coordinator(task_queue, args.sites, args.brands, args.categories, args.output, args.crawl_id,
+                                args.local_workers, lot_store=get_lot_store())
+        if items:
+            save_to_excel(items, args.output, profile=args.excel_profile)
+            if args.image_archive:
+                save_image_archive(items, args.output)
+        return 0
+    finally:
+        task_queue.close()
+
 class CrawlerThread(QThread):
-    update_progress = pyqtSignal(str, int, int, int, int)
+    update_progress = pyqtSignal(str, int, int, int, int, dict)
+    items_batch = pyqtSignal(list)
     finished = pyqtSignal(list)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
 
-    def __init__(self, session, brands, categories, output_folder, translator):
+    def __init__(self, session, brands, categories, output_folder, translator, resume=False, job=None, sites=None):
         QThread.__init__(self)
         self.session = session
+        self.sites = sites or [DEFAULT_SITE]
         self.brands = brands
         self.categories = categories
         self.output_folder = output_folder
         self.translator = translator
+        self.resume = resume
+        self.job = job or CrawlJob()
+        self.last_progress = 0.0
 
     def run(self):
-        items = search_and_crawl(self.session, self.brands, self.categories, self.output_folder, self.translator, self.progress_callback)
+        try:
+            sessions = {DEFAULT_SITE: self.session} if self.session else None
+            items = crawl_sites(self.sites, self.brands, self.categories, self.output_folder, self.translator, self.progress_callback, get_lot_store(), self.resume, self.items_batch.emit, self.job, sessions)
+        except CrawlCancelled:
+            crawl_metrics.inc("crawls_cancelled_total")
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
         self.finished.emit(items)
 
-    def progress_callback(self, brand, current_page, total_pages, items_found, images_downloaded):
-        self.update_progress.emit(brand, current_page, total_pages, items_found, images_downloaded)
-
-def save_to_spreadsheet(items):
+    def progress_callback(self, brand, current_page, total_pages, items_found, item_index):
+        # 항목마다 신호를 보내면 메인 스레드 이벤트 큐가 밀리므로 간격을 둠
+        now = time.monotonic()
+        if now - self.last_progress < GUI_PROGRESS_INTERVAL:
+            return
+        self.last_progress = now
+        self.update_progress.emit(brand, current_page, total_pages, items_found, item_index, crawl_metrics.snapshot())
+
+def image_display_path(output_folder, image):
+    # 표/엑셀에 넣을 때는 thumbs/의 작은 썸네일을 먼저 씀 (없으면 원본)
+    thumb_path = os.path.join(output_folder, 'images', 'thumbs', image)
+    return thumb_path if os.path.exists(thumb_path) else os.path.join(output_folder, 'images', image)
+
+@crawl_metrics.timed("export")
+def save_to_excel(items, output_folder, progress_callback=None, job=None, profile=DEFAULT_EXCEL_PROFILE):
+    # full: 썸네일을 시트에 넣음 (느림) / linked: 이미지 열을 썸네일 파일 링크로 / data: 이미지 없이 행만 씀
+    if profile not in EXCEL_PROFILES:
+        raise ValueError(f"알 수 없는 엑셀 저장 방식: {profile}")
+    started = time.perf_counter()
+    headers = ["Brand", "Title", "Rank", "Starting Price", "Image", "Time", "Relist Of"]
+    image_column = headers.index("Image")
+    if profile == "full":
+        wb = Workbook()
+        ws = wb.active
+    else:
+        # 이미지를 넣지 않으면 쓰기 전용 통합 문서로 행을 바로 흘려보냄
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet")
+
+    # Adjust column widths (쓰기 전용 시트는 행보다 먼저 정해야 함)
+    for col in range(1, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col)].width = 20
+    ws.append(headers)
+
+    for row, lot in enumerate(items, start=2):
+        values = lot.row() + [lot.relist_of]
+        if profile == "linked" and lot.image:
+            # 통합 문서 위치 기준 상대 경로라 결과 폴더째 옮겨도 링크가 유지됨
+            cell = WriteOnlyCell(ws, value=lot.image)
+            cell.hyperlink = os.path.relpath(image_display_path(output_folder, lot.image), output_folder).replace(os.sep, "/")
+            cell.style = "Hyperlink"
+            values[image_column] = cell
+        ws.append(values)
+
+        if profile == "full" and lot.image:
+            img_path = image_display_path(output_folder, lot.image)
+            if os.path.exists(img_path):
+                img = Image(img_path)
+                img.width = 100
+                img.height = 100
+                ws.add_image(img, f'E{row}')
+
+                # Adjust row height to fit the image
+                ws.row_dimensions[row].height = 75
+
+        if (row - 1) % EXPORT_PROGRESS_ROWS == 0:
+            if job:
+                job.checkpoint()
+            if progress_callback:
+                progress_callback(row - 1, len(items))
+
+    if progress_callback:
+        progress_callback(len(items), len(items))
+
+    file_path = os.path.join(output_folder, "crawling_results.xlsx")
+    wb.save(file_path)
+    elapsed = time.perf_counter() - started
+    rows_per_second = len(items) / elapsed if elapsed > 0 else 0
+    crawl_metrics.inc("excel_rows_total", len(items))
+    crawl_metrics.set_gauge(f"excel_{profile}_rows_per_second", round(rows_per_second, 1))
+    print(f"Data saved to {file_path} ({EXCEL_PROFILES[profile]}, {len(items)}행, {rows_per_second:.0f}행/초)")
+    return file_path
+
+def save_image_archive(items, output_folder, job=None):
+    # 엑셀 옆에 둘 이미지 묶음. 링크와 같은 상대 경로로 넣어서 같은 폴더에 풀면 링크가 그대로 열림
+    archive_path = os.path.join(output_folder, "crawling_results_images.zip")
+    added = set()
+    # JPEG는 이미 압축되어 있으므로 다시 압축하지 않음
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_STORED) as archive:
+        for lot in items:
+            if not lot.image or lot.image in added:
+                continue
+            if job:
+                job.checkpoint()
+            image_path = image_display_path(output_folder, lot.image)
+            if os.path.exists(image_path):
+                archive.write(image_path, os.path.relpath(image_path, output_folder).replace(os.sep, "/"))
+                added.add(lot.image)
+    print(f"이미지 {len(added)}개를 {archive_path}에 묶었습니다.")
+    return archive_path
+
+def get_sheets_client():
     scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
     creds = ServiceAccountCredentials.from_json_keyfile_name(SPREADSHEET_CREDENTIALS, scope)
     client = gspread.authorize(creds)
+    client.set_timeout(REQUEST_POLICIES["sheets"]["timeout"])
+    return client
+
+SHEET_HEADERS = ["선택", "Brand", "Title", "Rank", "Starting Price", "Image", "Time", "ID", "Relist Of"]
+SHEET_ID_COLUMN = SHEET_HEADERS.index("ID")
+
+def sheet_row(lot):
+    # 체크박스를 뺀 B~I 열 값 (시트에서 읽은 값과 비교할 수 있게 문자열로)
+    return [str(value) if value is not None else "" for value in lot.row() + [lot.id, lot.relist_of]]
+
+def sheet_cells(values):
+    return {"values": [{"userEnteredValue": {"boolValue": value} if isinstance(value, bool) else {"stringValue": value}}
+                       for value in values]}
+
+def spreadsheet_diff_requests(sheet_id, current_rows, items):
+    # 시트 내용(get_all_values, 헤더 포함)과 경매품 목록을 ID 열로 비교해
+    # 행 삭제/수정/추가 요청을 만듦. 남는 행의 체크박스(A열)는 건드리지 않음
+    requests = []
+    if not current_rows:
+        requests.append({"appendCells": {"sheetId": sheet_id, "rows": [sheet_cells(SHEET_HEADERS)], "fields": "userEnteredValue"}})
+    elif current_rows[0] != SHEET_HEADERS:
+        # 예전 열 구성으로 만든 시트는 헤더만 새로 씀 (값 열은 아래에서 행마다 맞춤)
+        requests.append({"updateCells": {"start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                                         "rows": [sheet_cells(SHEET_HEADERS)], "fields": "userEnteredValue"}})
+
+    wanted = {}
+    for lot in items:
+        if lot.id and lot.id not in wanted:
+            wanted[lot.id] = sheet_row(lot)
+
+    kept = []
+    deleted = []
+    seen = set()
+    for index, row in enumerate(current_rows[1:], start=1):
+        lot_id = row[SHEET_ID_COLUMN] if len(row) > SHEET_ID_COLUMN else ""
+        if lot_id in wanted and lot_id not in seen:
+            seen.add(lot_id)
+            kept.append((lot_id, row))
+        else:
+            deleted.append(index)
 
-    spreadsheet = client.create(f"크롤링 결과 {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    sheet = spreadsheet.get_worksheet(0)
-
-    headers = ["선택", "Brand", "Title", "Rank", "Starting Price", "Image", "Time"]
-    sheet.append_row(headers)
-
-    for item in items:
-        row = [False, item["Brand"], item["Title"], item["Rank"], item["Starting Price"], item["Image"], item["Time"]]
-        sheet.append_row(row)
+    # 아래쪽 구간부터 지워야 위쪽 행 번호가 바뀌지 않음
+    runs = []
+    for index in deleted:
+        if runs and runs[-1][1] == index:
+            runs[-1][1] = index + 1
+        else:
+            runs.append([index, index + 1])
+    for start, end in reversed(runs):
+        requests.append({"deleteDimension": {"range": {"sheetId": sheet_id, "dimension": "ROWS",
+                                                       "startIndex": start, "endIndex": end}}})
+
+    updated = 0
+    for position, (lot_id, row) in enumerate(kept, start=1):
+        width = len(SHEET_HEADERS) - 1
+        current = (row[1:width + 1] + [""] * width)[:width]
+        if current != wanted[lot_id]:
+            requests.append({"updateCells": {"start": {"sheetId": sheet_id, "rowIndex": position, "columnIndex": 1},
+                                             "rows": [sheet_cells(wanted[lot_id])], "fields": "userEnteredValue"}})
+            updated += 1
+
+    new_rows = []
+    for lot in items:
+        if not lot.id:
+            new_rows.append([False] + sheet_row(lot))
+        elif lot.id not in seen:
+            seen.add(lot.id)
+            new_rows.append([False] + wanted[lot.id])
+    if new_rows:
+        requests.append({"appendCells": {"sheetId": sheet_id, "rows": [sheet_cells(row) for row in new_rows],
+                                         "fields": "userEnteredValue"}})
 
     # 체크박스 열 추가
-    if len(items) > 0:
-        checkbox_range = f'A2:A{len(items)+1}'
-        checkbox_request = {
+    row_count = len(kept) + len(new_rows)
+    if new_rows:
+        requests.append({
             'repeatCell': {
                 'range': {
-                    'sheetId': sheet.id,
+                    'sheetId': sheet_id,
                     'startRowIndex': 1,
-                    'endRowIndex': len(items) + 1,
+                    'endRowIndex': row_count + 1,
                     'startColumnIndex': 0,
                     'endColumnIndex': 1
                 },
@@ -304,56 +2618,108 @@ def save_to_spreadsheet(items):
                 },
                 'fields': 'dataValidation'
             }
-        }
-        spreadsheet.batch_update({'requests': [checkbox_request]})
+        })
+
+    return requests, {"inserted": len(new_rows), "updated": updated, "deleted": len(deleted)}
 
-    # 권한 설정 (누구나 편집 가능하게)
-    spreadsheet.share('', perm_type='anyone', role='writer')
+def open_registered_spreadsheet(client, lot_store, brand, category):
+    entry = lot_store.get_spreadsheet(brand, category)
+    if not entry:
+        return None
+    try:
+        return resilience.call(client.open_by_key, entry["spreadsheet_id"], endpoint="sheets")
+    except (gspread.exceptions.SpreadsheetNotFound, APIError) as e:
+        print(f"등록된 스프레드시트를 열 수 없어 새로 만듭니다 ({brand} / {category}): {e}")
+        return None
+
+@crawl_metrics.timed("export")
+def save_to_spreadsheet(items, brand=None, category=None, lot_store=None, job=None):
+    # 브랜드/카테고리가 주어지면 검색별 스프레드시트를 재사용하고 바뀐 행만 반영
+    client = get_sheets_client()
+    registry = (lot_store or get_lot_store()) if brand and category else None
+
+    spreadsheet = open_registered_spreadsheet(client, registry, brand, category) if registry else None
+    created = spreadsheet is None
+    if created:
+        title = f"크롤링 결과 {brand} {category}" if registry else f"크롤링 결과 {time.strftime('%Y-%m-%d %H:%M:%S')}"
+        spreadsheet = resilience.call(client.create, title, endpoint="sheets", job=job)
+        # 권한 설정 (누구나 편집 가능하게)
+        resilience.call(spreadsheet.share, '', perm_type='anyone', role='writer', endpoint="sheets", job=job)
+        if registry:
+            registry.register_spreadsheet(brand, category, spreadsheet.id, spreadsheet.url)
+
+    sheet = resilience.call(spreadsheet.get_worksheet, 0, endpoint="sheets", job=job)
+    current_rows = [] if created else resilience.call(sheet.get_all_values, endpoint="sheets", job=job)
+
+    requests, counts = spreadsheet_diff_requests(sheet.id, current_rows, items)
+    if requests:
+        resilience.call(spreadsheet.batch_update, {'requests': requests}, endpoint="sheets", job=job)
+    for name, count in counts.items():
+        crawl_metrics.inc(f"sheet_rows_{name}_total", count)
+    print(f"스프레드시트 반영: 추가 {counts['inserted']}, 수정 {counts['updated']}, 삭제 {counts['deleted']}")
 
     return spreadsheet.url
 
+def picked_row_key(row):
+    # Brand, Title, Rank, Starting Price, Image, Time, ID 순서
+    if len(row) > 6 and row[6]:
+        return row[6]
+    return tuple(row[:6])
+
+_monitored_spreadsheets = set()
+_monitored_spreadsheets_lock = threading.Lock()
+
 def monitor_spreadsheet(spreadsheet_url):
     global PERSONAL_SPREADSHEET_ID
     PERSONAL_SPREADSHEET_ID = '1hKT6EFt5OvUiHUx70C15udp7OIeikLiy3egWJ9UDSeQ'
+
+    # 검색별 스프레드시트를 재사용하므로 같은 시트는 한 번만 모니터링
+    with _monitored_spreadsheets_lock:
+        if spreadsheet_url in _monitored_spreadsheets:
+            print(f"이미 모니터링 중: {spreadsheet_url}")
+            return
+        _monitored_spreadsheets.add(spreadsheet_url)
     
     print(f"모니터링 시작: {spreadsheet_url}")
     
     try:
-        scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-        creds = ServiceAccountCredentials.from_json_keyfile_name(SPREADSHEET_CREDENTIALS, scope)
-        client = gspread.authorize(creds)
+        client = get_sheets_client()
         print("Google Sheets API 인증 성공")
 
-        source_spreadsheet = client.open_by_url(spreadsheet_url)
-        source_sheet = source_spreadsheet.get_worksheet(0)
+        source_spreadsheet = resilience.call(client.open_by_url, spreadsheet_url, endpoint="sheets")
+        source_sheet = resilience.call(source_spreadsheet.get_worksheet, 0, endpoint="sheets")
         print(f"원본 스프레드시트 열기 성공: {source_spreadsheet.title}")
 
-        personal_spreadsheet = client.open_by_key(PERSONAL_SPREADSHEET_ID)
+        personal_spreadsheet = resilience.call(client.open_by_key, PERSONAL_SPREADSHEET_ID, endpoint="sheets")
         print(f"개인 스프레드시트 열기 성공: {personal_spreadsheet.title}")
         
         today = datetime.date.today()
         sheet_name = today.strftime("%Y-%m-%d")
         
         try:
-            personal_sheet = personal_spreadsheet.worksheet(sheet_name)
+            personal_sheet = resilience.call(personal_spreadsheet.worksheet, sheet_name, endpoint="sheets")
             print(f"'{sheet_name}' 시트를 찾았습니다.")
         except gspread.exceptions.WorksheetNotFound:
             print(f"'{sheet_name}' 시트를 찾을 수 없습니다. 새로 생성합니다.")
-            personal_sheet = personal_spreadsheet.add_worksheet(title=sheet_name, rows="100", cols="20")
+            personal_sheet = resilience.call(personal_spreadsheet.add_worksheet, title=sheet_name, rows="100", cols="20", endpoint="sheets")
             print(f"'{sheet_name}' 시트가 생성되었습니다.")
             
-            headers = ["Brand", "Title", "Rank", "Starting Price", "Image", "Time"]
-            personal_sheet.append_row(headers)
+            headers = ["Brand", "Title", "Rank", "Starting Price", "Image", "Time", "ID"]
+            resilience.call(personal_sheet.append_row, headers, endpoint="sheets")
             print("헤더 추가 완료")
 
+        # 이미 옮겨진 항목은 경매품 ID(없으면 행 전체)로 한 번만 읽어 두고 중복 확인
+        picked_keys = {picked_row_key(row) for row in resilience.call(personal_sheet.get_all_values, endpoint="sheets")[1:]}
+        print(f"개인 시트의 기존 항목 {len(picked_keys)}개")
+
         last_checked_row = 1  # 헤더를 포함하여 시작
 
         while True:
             try:
                 # 체크박스 열의 값을 별도로 가져옵니다.
-                checkbox_values = source_sheet.get_values('A2:A')
+                checkbox_values = resilience.call(source_sheet.get_values, 'A2:A', endpoint="sheets")
                 # 나머지 데이터를 가져옵니다.
-                values = source_sheet.get_values('B2:G')
+                values = resilience.call(source_sheet.get_values, 'B2:H', endpoint="sheets")
 
                 print(f"원본 시트에서 {len(values)} 행의 데이터를 가져왔습니다.")
                 
@@ -364,9 +2730,10 @@ def monitor_spreadsheet(spreadsheet_url):
                     
                     if checkbox_value == 'TRUE':
                         print(f"선택된 행 발견: {row[:3]}...")  # Brand, Title, Rank만 출력
-                        existing_rows = personal_sheet.get_all_values()
-                        if row not in existing_rows:
-                            personal_sheet.append_row(row)
+                        row_key = picked_row_key(row)
+                        if row_key not in picked_keys:
+                            resilience.call(personal_sheet.append_row, row, endpoint="sheets")
+                            picked_keys.add(row_key)
                             print(f"새 항목 추가됨: {row[0]}, {row[1]}")
                         else:
                             print(f"중복 항목 발견, 건너뜁니다: {row[0]}, {row[1]}")
@@ -376,8 +2743,8 @@ def monitor_spreadsheet(spreadsheet_url):
                 last_checked_row = len(values) + 1
                 print(f"마지막으로 확인한 행: {last_checked_row}")
             except gspread.exceptions.APIError as e:
-                print(f"API 에러 발생: {e}")
-                time.sleep(60)
+                # 재시도와 호스트 일시 정지는 resilience 계층에서 처리됨
+                print(f"API 에러 발생 (재시도 후 실패): {e}")
             except Exception as e:
                 print(f"예외 발생: {e}")
                 print(f"예외 타입: {type(e)}")
@@ -389,6 +2756,8 @@ def monitor_spreadsheet(spreadsheet_url):
         print(f"monitor_spreadsheet에서 오류 발생: {e}")
         print(f"오류 타입: {type(e)}")
         print(f"오류 인자: {e.args}")
+        with _monitored_spreadsheets_lock:
+            _monitored_spreadsheets.discard(spreadsheet_url)
 
 def parse_user_input(input_text):
     # 브랜드와 카테고리 매핑 정의
@@ -424,6 +2793,76 @@ def parse_user_input(input_text):
 def send_welcome(message):
     bot.reply_to(message, "안녕하세요! 저는 까사트레이드의 봇 입니다 원하시는 제품을 채팅창에 입력 하시면 현재 올라온 경매출품 목록들을 보실수 있습니다. (예: 샤넬 가방)")
 
+@bot.message_handler(commands=['lots'])
+def send_stored_lots(message):
+    # 예: /lots 샤넬 가방 200000  → 저장소에서 바로 조회 (재크롤링 없음)
+    query = message.text.split(maxsplit=1)[1] if len(message.text.split(maxsplit=1)) > 1 else ""
+    brand, category = parse_user_input(query)
+    if not brand:
+        bot.reply_to(message, "브랜드를 입력해주세요. (예: /lots 샤넬 가방 200000)")
+        return
+
+    prices = [int(word.replace(",", "")) for word in query.split() if word.replace(",", "").isdigit()]
+    max_price = prices[0] if prices else None
+
+    items = get_lot_store().query_lots(brand=brand, category=category, max_price=max_price, limit=30)
+    if not items:
+        bot.reply_to(message, "저장된 경매품이 없습니다. 먼저 검색해주세요. (예: 샤넬 가방)")
+        return
+
+    lines = [f"{lot.title} | {lot.rank} | {lot.starting_price} | {lot.time}" for lot in items]
+    bot.reply_to(message, f"저장된 경매품 {len(items)}건\n" + "\n".join(lines))
+
+def command_argument(message):
+    parts = message.text.split(maxsplit=1)
+    return parts[1] if len(parts) > 1 else ""
+
+@bot.message_handler(commands=['watch'])
+def add_watch(message):
+    # 예: /watch 샤넬 가방 → 새 경매품과 가격 변동이 생길 때마다 알림
+    query = command_argument(message)
+    brand, category = parse_user_input(query)
+    if not brand or not category:
+        bot.reply_to(message, "브랜드와 카테고리를 입력해주세요. (예: /watch 샤넬 가방)")
+        return
+
+    get_lot_store().add_watch(message.chat.id, brand, category, query.strip())
+    bot.reply_to(message, f"'{query.strip()}' 구독을 시작했습니다. 새 경매품이나 가격 변동이 있으면 알려드립니다.")
+
+@bot.message_handler(commands=['unwatch'])
+def remove_watch(message):
+    # 예: /unwatch 샤넬 가방, 조건 없이 /unwatch 하면 전체 해지
+    query = command_argument(message)
+    brand, category = parse_user_input(query)
+    if query.strip() and (not brand or not category):
+        bot.reply_to(message, "브랜드와 카테고리를 입력해주세요. (예: /unwatch 샤넬 가방)")
+        return
+
+    removed = get_lot_store().remove_watch(message.chat.id, brand, category)
+    bot.reply_to(message, f"구독 {removed}건을 해지했습니다." if removed else "해지할 구독이 없습니다.")
+
+@bot.message_handler(commands=['watches'])
+def list_watches(message):
+    watches = get_lot_store().list_watches(message.chat.id)
+    if not watches:
+        bot.reply_to(message, "구독 중인 검색이 없습니다. (예: /watch 샤넬 가방)")
+        return
+    bot.reply_to(message, "구독 중인 검색\n" + "\n".join(f"- {watch['label']}" for watch in watches))
+
+# 채팅방별로 실행 중인 크롤링 작업 (/cancel로 취소)
+active_jobs = {}
+active_jobs_lock = threading.Lock()
+
+@bot.message_handler(commands=['cancel'])
+def cancel_crawl(message):
+    with active_jobs_lock:
+        job = active_jobs.get(message.chat.id)
+    if not job:
+        bot.reply_to(message, "진행 중인 크롤링이 없습니다.")
+        return
+    job.cancel()
+    bot.reply_to(message, "크롤링을 취소하는 중입니다. 진행 중인 요청이 끝나면 멈춥니다.")
+
 @bot.message_handler(func=lambda message: True)
 def handle_message(message):
     brand, category = parse_user_input(message.text)
@@ -432,22 +2871,346 @@ def handle_message(message):
         bot.reply_to(message, "죄송합니다. 브랜드와 카테고리를 정확히 입력해주세요. (예: 샤넬 가방)")
         return
 
-    session = login_and_check()
-    if not session:
-        bot.reply_to(message, "죄송합니다. 로그인에 실패했습니다. 나중에 다시 시도해주세요.")
+    lot_store = get_lot_store()
+    lot_store.record_query(brand, category)
+
+    # 미리 크롤링해 둔 최신 데이터가 있으면 크롤링 없이 바로 응답
+    items = lot_store.warm_lots(brand, category)
+    if items is not None:
+        crawl_metrics.inc("prefetch_hits_total")
+        spreadsheet_url = save_to_spreadsheet(items, brand, category, lot_store)
+        bot.reply_to(message, f"최근 크롤링 결과입니다. 결과를 확인해주세요: {spreadsheet_url}")
+        threading.Thread(target=monitor_spreadsheet, args=(spreadsheet_url,), daemon=True).start()
         return
+    crawl_metrics.inc("prefetch_misses_total")
+
+    # 같은 채팅의 중복 요청은 로그인 전에 거절
+    with active_jobs_lock:
+        if message.chat.id in active_jobs:
+            bot.reply_to(message, "이미 진행 중인 크롤링이 있습니다. 취소하려면 /cancel 을 입력해주세요.")
+            return
+        job = active_jobs[message.chat.id] = CrawlJob()
 
-    output_folder = create_output_folder(brand)
-    translator = Translator()
+    # 크롤링은 별도 스레드에서 실행해 봇 처리 스레드(기본 2개)가 /cancel 등 다른 메시지를 계속 받게 함
+    threading.Thread(target=run_chat_crawl, args=(message, brand, category, lot_store, job), daemon=True).start()
+
+def run_chat_crawl(message, brand, category, lot_store, job):
+    try:
+        session = login_and_check()
+        if not session:
+            bot.reply_to(message, "죄송합니다. 로그인에 실패했습니다. 나중에 다시 시도해주세요.")
+            return
 
-    # 여기서 크롤링 함수를 호출하고 결과를 스프레드시트에 저장
-    items = search_and_crawl(session, [brand], [category], output_folder, translator)
-    spreadsheet_url = save_to_spreadsheet(items)
+        output_folder = create_output_folder(brand)
+        translator = make_translator()
+
+        # 여기서 크롤링 함수를 호출하고 결과를 스프레드시트에 저장
+        started_at = datetime.datetime.now()
+        items = search_and_crawl(session, [brand], [category], output_folder, translator, lot_store=lot_store, job=job)
+        lot_store.mark_crawled(brand, category, started_at, len(items))
+        spreadsheet_url = save_to_spreadsheet(items, brand, category, lot_store, job)
+    except CrawlCancelled:
+        crawl_metrics.inc("crawls_cancelled_total")
+        bot.reply_to(message, "크롤링을 취소했습니다.")
+        return
+    except Exception as e:
+        print(f"크롤링 오류 ({brand} / {category}): {e}")
+        bot.reply_to(message, "죄송합니다. 크롤링 중 오류가 발생했습니다. 나중에 다시 시도해주세요.")
+        return
+    finally:
+        with active_jobs_lock:
+            active_jobs.pop(message.chat.id, None)
     bot.reply_to(message, f"크롤링이 완료되었습니다. 결과를 확인해주세요: {spreadsheet_url}")
 
     # 모니터링 시작
     threading.Thread(target=monitor_spreadsheet, args=(spreadsheet_url,), daemon=True).start()
 
+class PrefetchScheduler(threading.Thread):
+    # 봇 요청 빈도를 보고 인기 (브랜드, 카테고리) 조합을 미리 크롤링해 둠
+    def __init__(self, lot_store, top_n=PREFETCH_TOP_N, max_crawls_per_hour=PREFETCH_MAX_CRAWLS_PER_HOUR,
+                 check_interval=PREFETCH_CHECK_INTERVAL, quiet_hours=PREFETCH_QUIET_HOURS):
+        threading.Thread.__init__(self, daemon=True)
+        self.lot_store = lot_store
+        self.top_n = top_n
+        self.max_crawls_per_hour = max_crawls_per_hour
+        self.check_interval = check_interval
+        self.quiet_hours = quiet_hours
+        self.crawl_times = []
+        self.stop_event = threading.Event()
+
+    def top_queries(self, now):
+        # 최근 요청일수록 가중치가 큰 지수 감쇠 점수
+        scores = {}
+        for brand, category, requested_at in self.lot_store.recent_queries():
+            age_days = (now - requested_at).total_seconds() / 86400
+            scores[(brand, category)] = scores.get((brand, category), 0.0) + 0.5 ** (age_days / PREFETCH_HALF_LIFE_DAYS)
+        return sorted(scores, key=scores.get, reverse=True)[:self.top_n]
+
+    def learned_quiet_hours(self):
+        if self.quiet_hours is not None:
+            return set(self.quiet_hours)
+        # 설정이 없으면 요청이 가장 적은 6개 시간대를 한가한 시간으로 봄
+        counts = {hour: 0 for hour in range(24)}
+        for _, _, requested_at in self.lot_store.recent_queries():
+            counts[requested_at.hour] += 1
+        return set(sorted(counts, key=lambda hour: (counts[hour], hour))[:6])
+
+    def budget_left(self, now):
+        self.crawl_times = [t for t in self.crawl_times if now - t < datetime.timedelta(hours=1)]
+        return self.max_crawls_per_hour - len(self.crawl_times)
+
+    def due_queries(self, now):
+        quiet = now.hour in self.learned_quiet_hours()
+        due = []
+        for brand, category in self.top_queries(now):
+            crawled_at = self.lot_store.last_crawled(brand, category)
+            if crawled_at and now - crawled_at < datetime.timedelta(minutes=PREFETCH_FRESH_MINUTES):
+                continue
+            next_auction = self.lot_store.next_auction_date(brand, category)
+            auction_soon = next_auction and next_auction - now < datetime.timedelta(hours=PREFETCH_AUCTION_LEAD_HOURS)
+            if quiet or auction_soon:
+                due.append((brand, category))
+        return due
+
+    def run_once(self, now=None):
+        now = now or datetime.datetime.now()
+        due = self.due_queries(now)
+        budget = self.budget_left(now)
+        if not due or budget <= 0:
+            return 0
+
+        session = login_and_check()
+        if not session:
+            print("미리 크롤링: 로그인 실패")
+            return 0
+
+        crawled = 0
+        translator = make_translator()
+        for brand, category in due[:budget]:
+            print(f"미리 크롤링: {brand} / {category}")
+            started_at = datetime.datetime.now()
+            try:
+                items = search_and_crawl(session, [brand], [category], create_output_folder(brand), translator,
+                                         lot_store=self.lot_store)
+            except Exception as e:
+                print(f"미리 크롤링 실패 ({brand} / {category}): {e}")
+                continue
+            self.lot_store.mark_crawled(brand, category, started_at, len(items))
+            self.crawl_times.append(datetime.datetime.now())
+            crawl_metrics.inc("prefetch_crawls_total")
+            crawled += 1
+        return crawled
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"미리 크롤링 스케줄러 오류: {e}")
+            self.stop_event.wait(self.check_interval)
+
+    def stop(self):
+        self.stop_event.set()
+
+class TelegramSendQueue(threading.Thread):
+    # 텔레그램 전송 제한(전체 초당 약 30건, 채팅당 초당 1건)에 맞춰 메시지를 순서대로 보냄
+    def __init__(self, telegram_bot=bot, messages_per_second=TELEGRAM_MESSAGES_PER_SECOND,
+                 chat_interval=TELEGRAM_CHAT_INTERVAL):
+        threading.Thread.__init__(self, daemon=True)
+        self.bot = telegram_bot
+        self.interval = 1.0 / messages_per_second
+        self.chat_interval = chat_interval
+        self.queue = queue.Queue()
+        self.last_sent = 0.0
+        self.last_sent_by_chat = {}
+
+    def send(self, chat_id, text):
+        self.queue.put((chat_id, text))
+        crawl_metrics.set_gauge("telegram_queue_depth", self.queue.qsize())
+
+    def wait_turn(self, chat_id):
+        now = time.monotonic()
+        ready_at = max(self.last_sent + self.interval, self.last_sent_by_chat.get(chat_id, 0.0) + self.chat_interval)
+        if ready_at > now:
+            time.sleep(ready_at - now)
+
+    def deliver(self, chat_id, text):
+        for attempt in range(TELEGRAM_SEND_RETRIES + 1):
+            self.wait_turn(chat_id)
+            try:
+                self.bot.send_message(chat_id, text, disable_web_page_preview=True)
+                crawl_metrics.inc("telegram_messages_sent_total")
+                return True
+            except ApiTelegramException as e:
+                if e.error_code != 429 or attempt == TELEGRAM_SEND_RETRIES:
+                    print(f"텔레그램 전송 실패 ({chat_id}): {e}")
+                    return False
+                # 제한에 걸리면 텔레그램이 알려준 시간만큼 쉬고 다시 보냄
+                retry_after = (e.result_json or {}).get("parameters", {}).get("retry_after", 1)
+                crawl_metrics.inc("telegram_rate_limited_total")
+                time.sleep(retry_after)
+            finally:
+                self.last_sent = time.monotonic()
+                self.last_sent_by_chat[chat_id] = self.last_sent
+        return False
+
+    def run(self):
+        while True:
+            chat_id, text = self.queue.get()
+            try:
+                self.deliver(chat_id, text)
+            except Exception as e:
+                print(f"텔레그램 전송 오류 ({chat_id}): {e}")
+            finally:
+                crawl_metrics.set_gauge("telegram_queue_depth", self.queue.qsize())
+                self.queue.task_done()
+
+send_queue = TelegramSendQueue()
+
+def format_lot_updates(label, new_lots, changed, max_length=TELEGRAM_MESSAGE_LIMIT):
+    # 신규/가격 변동 경매품을 한 줄씩 묶어 텔레그램 길이 제한 안의 메시지들로 나눔
+    lines = [f"[신규] {lot.title} | {lot.rank} | {lot.starting_price} | {lot.time}" for lot in new_lots]
+    # 이전 가격이 없던(N/A) 경매품은 가격이 새로 공개된 경우
+    lines += [f"[가격변동] {lot.title} | {'N/A' if old_price is None else f'{old_price:,}엔'} → {lot.starting_price}"
+              for lot, old_price in changed]
+
+    header = f"🔔 {label}: 신규 {len(new_lots)}건, 가격변동 {len(changed)}건"
+    messages = []
+    current = header
+    for line in lines:
+        if len(current) + len(line) + 1 > max_length:
+            messages.append(current)
+            current = header + " (계속)"
+        current += "\n" + line
+    messages.append(current)
+    return messages
+
+class WatchService(threading.Thread):
+    # 구독된 (브랜드, 카테고리)마다 한 번만 크롤링하고, 달라진 경매품만 구독자들에게 보냄
+    def __init__(self, lot_store, sender, interval=WATCH_INTERVAL):
+        threading.Thread.__init__(self, daemon=True)
+        self.lot_store = lot_store
+        self.sender = sender
+        self.interval = interval
+        self.stop_event = threading.Event()
+
+    def subscribers_by_query(self):
+        queries = {}
+        for watch in self.lot_store.list_watches():
+            queries.setdefault((watch["brand"], watch["category"]), []).append(watch)
+        return queries
+
+    def run_once(self):
+        queries = self.subscribers_by_query()
+        if not queries:
+            return 0
+
+        session = login_and_check()
+        if not session:
+            print("구독 크롤링: 로그인 실패")
+            return 0
+
+        translator = make_translator()
+        pushed = 0
+        for (brand, category), watches in queries.items():
+            started_at = datetime.datetime.now()
+            try:
+                items = search_and_crawl(session, [brand], [category], create_output_folder(brand), translator,
+                                         lot_store=self.lot_store)
+            except Exception as e:
+                print(f"구독 크롤링 실패 ({brand} / {category}): {e}")
+                continue
+            self.lot_store.mark_crawled(brand, category, started_at, len(items))
+            crawl_metrics.inc("watch_crawls_total")
+
+            # 한 검색의 알림이 실패해도 나머지 구독 검색은 계속 처리
+            try:
+                new_lots, changed = self.lot_store.diff_snapshot(brand, category, items)
+                if not new_lots and not changed:
+                    continue
+                crawl_metrics.inc("watch_new_lots_total", len(new_lots))
+                crawl_metrics.inc("watch_price_changes_total", len(changed))
+                for watch in watches:
+                    for text in format_lot_updates(watch["label"], new_lots, changed):
+                        self.sender.send(watch["chat_id"], text)
+                        pushed += 1
+            except Exception as e:
+                print(f"구독 알림 실패 ({brand} / {category}): {e}")
+        return pushed
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"구독 크롤링 오류: {e}")
+            self.stop_event.wait(self.interval)
+
+    def stop(self):
+        self.stop_event.set()
+
+class ImageLoader(QThread):
+    # 썸네일을 작업 스레드에서 QImage로 읽고 줄여서 묶음으로 보냄 (QPixmap 변환만 메인 스레드)
+    images_loaded = pyqtSignal(list)
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, rows, batch_size=GUI_IMAGE_BATCH_SIZE):
+        QThread.__init__(self)
+        self.rows = rows
+        self.batch_size = batch_size
+
+    def run(self):
+        batch = []
+        for done, (row, image_path) in enumerate(self.rows, 1):
+            if self.isInterruptionRequested():
+                return
+            image = QImage(image_path)
+            if image.isNull():
+                batch.append((row, None))
+            else:
+                batch.append((row, image.scaled(QSize(GUI_THUMBNAIL_SIZE, GUI_THUMBNAIL_SIZE), Qt.KeepAspectRatio, Qt.SmoothTransformation)))
+            if len(batch) >= self.batch_size or done == len(self.rows):
+                self.images_loaded.emit(batch)
+                self.progress.emit(done, len(self.rows))
+                batch = []
+
+class ExportThread(QThread):
+    # 엑셀/스프레드시트 저장을 메인 스레드 밖에서 실행
+    progress = pyqtSignal(str, int, int)
+    finished = pyqtSignal(str, str)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, items, output_folder, job=None, excel_profile=DEFAULT_EXCEL_PROFILE, image_archive=False):
+        QThread.__init__(self)
+        self.items = items
+        self.output_folder = output_folder
+        self.job = job or CrawlJob()
+        self.excel_profile = excel_profile
+        self.image_archive = image_archive
+
+    def run(self):
+        started = time.perf_counter()
+
+        def excel_progress(done, total):
+            elapsed = time.perf_counter() - started
+            rate = f" {done / elapsed:.0f}행/초" if done and elapsed > 0 else ""
+            self.progress.emit(f"엑셀({EXCEL_PROFILES[self.excel_profile]}{rate})", done, total)
+
+        try:
+            excel_path = save_to_excel(self.items, self.output_folder, excel_progress, self.job, self.excel_profile)
+            if self.image_archive:
+                self.progress.emit("이미지 압축", 0, len(self.items))
+                save_image_archive(self.items, self.output_folder, self.job)
+            self.progress.emit("스프레드시트", 0, len(self.items))
+            spreadsheet_url = save_to_spreadsheet(self.items, job=self.job)
+            self.progress.emit("스프레드시트", len(self.items), len(self.items))
+            self.finished.emit(excel_path, spreadsheet_url)
+        except CrawlCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -480,6 +3243,15 @@ class MainWindow(QMainWindow):
             category_layout.addWidget(button)
             self.category_buttons.append((button, category_id))
 
+        # 사이트 선택 (여러 개 선택하면 병렬로 크롤링)
+        category_layout.addWidget(QLabel("사이트 선택:"))
+        self.site_checkboxes = []
+        for site, label in (("ecoauc", "에코옥션"), ("penguin", "펭귄옥션")):
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(site == DEFAULT_SITE)
+            category_layout.addWidget(checkbox)
+            self.site_checkboxes.append((checkbox, site))
+
         brand_layout.addLayout(category_layout)
         layout.addLayout(brand_layout)
 
@@ -492,10 +3264,37 @@ class MainWindow(QMainWindow):
         save_layout.addWidget(save_button)
         layout.addLayout(save_layout)
 
+        # 중단된 크롤링 이어하기
+        self.resume_checkbox = QCheckBox("중단된 크롤링 이어하기")
+        layout.addWidget(self.resume_checkbox)
+
+        # 엑셀 저장 방식 (이미지를 넣는 방식이 가장 느림)
+        excel_layout = QHBoxLayout()
+        excel_layout.addWidget(QLabel("엑셀 저장 방식:"))
+        self.excel_profile_combo = QComboBox()
+        for profile, label in EXCEL_PROFILES.items():
+            self.excel_profile_combo.addItem(label, profile)
+        excel_layout.addWidget(self.excel_profile_combo)
+        self.image_archive_checkbox = QCheckBox("이미지 압축 파일 함께 저장")
+        excel_layout.addWidget(self.image_archive_checkbox)
+        layout.addLayout(excel_layout)
+
         # 실행 버튼
+        run_layout = QHBoxLayout()
         self.run_button = QPushButton("크롤링 시작")
         self.run_button.clicked.connect(self.start_crawling)
-        layout.addWidget(self.run_button)
+        run_layout.addWidget(self.run_button)
+
+        # 일시정지/재개, 취소 버튼 (실행 중인 작업에만 적용)
+        self.pause_button = QPushButton("일시정지")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.pause_button.setEnabled(False)
+        run_layout.addWidget(self.pause_button)
+        self.cancel_button = QPushButton("취소")
+        self.cancel_button.clicked.connect(self.cancel_job)
+        self.cancel_button.setEnabled(False)
+        run_layout.addWidget(self.cancel_button)
+        layout.addLayout(run_layout)
 
         # 진행 상황 표시
         self.progress_bar = QProgressBar()
@@ -508,7 +3307,8 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.result_tabs)
 
         self.output_folder = None
-        self.translator = Translator()
+        self.translator = make_translator()
+        self.image_loader = None
 
     def select_save_location(self):
         folder = QFileDialog.getExistingDirectory(self, "저장 위치 선택")
@@ -531,72 +3331,205 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "경고", "카테고리를 선택해주세요.")
             return
 
-        session = login_and_check()
-        if not session:
-            QMessageBox.critical(self, "오류", "로그인에 실패했습니다.")
+        selected_sites = [site for checkbox, site in self.site_checkboxes if checkbox.isChecked()]
+        if not selected_sites:
+            QMessageBox.warning(self, "경고", "사이트를 선택해주세요.")
             return
 
-        self.crawler_thread = CrawlerThread(session, selected_brands, selected_categories, self.output_folder, self.translator)
+        # 에코옥션 로그인은 바로 확인하고, 다른 사이트는 크롤링 스레드에서 로그인
+        session = None
+        if DEFAULT_SITE in selected_sites:
+            session = login_and_check()
+            if not session:
+                QMessageBox.critical(self, "오류", "로그인에 실패했습니다.")
+                return
+
+        self.job = CrawlJob()
+        self.crawler_thread = CrawlerThread(session, selected_brands, selected_categories, self.output_folder, self.translator, self.resume_checkbox.isChecked(), self.job, selected_sites)
         self.crawler_thread.update_progress.connect(self.update_progress)
+        self.crawler_thread.items_batch.connect(self.append_items)
         self.crawler_thread.finished.connect(self.crawling_finished)
+        self.crawler_thread.cancelled.connect(self.job_cancelled)
+        self.crawler_thread.failed.connect(self.crawling_failed)
+
+        # 이전 결과의 썸네일을 아직 불러오는 중이면 멈추고, 남은 묶음이 새 표에 들어가지 않게 연결을 끊음
+        self.stop_image_loader()
+        self.result_lots = []
+        self.result_table = self.create_result_table()
+        self.result_tabs.addTab(self.result_table, "크롤링 결과")
+        self.result_tabs.setCurrentWidget(self.result_table)
+
         self.crawler_thread.start()
 
         self.run_button.setEnabled(False)
+        self.pause_button.setText("일시정지")
+        self.pause_button.setEnabled(True)
+        self.cancel_button.setEnabled(True)
+
+    def toggle_pause(self):
+        if self.job.paused:
+            self.job.resume()
+            self.pause_button.setText("일시정지")
+            self.progress_label.setText("재개됨")
+        else:
+            self.job.pause()
+            self.pause_button.setText("재개")
+            self.progress_label.setText("일시정지됨 (진행 중인 요청은 마무리 후 멈춤)")
 
-    def update_progress(self, brand, current_page, total_pages, items_found, images_downloaded):
-        self.progress_label.setText(f"브랜드: {brand}, 페이지: {current_page}/{total_pages}, 아이템: {items_found}, 이미지: {images_downloaded}")
-        self.progress_bar.setValue(int(current_page / total_pages * 100))
+    def cancel_job(self):
+        self.job.cancel()
+        self.pause_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        self.progress_label.setText("취소 중... (진행 중인 요청이 끝나면 멈춤)")
 
-    def crawling_finished(self, items):
+    def crawling_failed(self, error):
         self.run_button.setEnabled(True)
-        self.progress_bar.setValue(100)
-        self.progress_label.setText("크롤링 완료")
+        self.pause_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        self.progress_label.setText(f"크롤링 실패: 받은 항목 {len(self.result_lots)}건 (이어하기로 다시 시작 가능)")
+        QMessageBox.critical(self, "오류", f"크롤링 중 오류가 발생했습니다: {error}")
 
-        # 결과를 표로 표시
-        result_table = QTableWidget()
-        result_table.setColumnCount(6)
-        result_table.setHorizontalHeaderLabels(["Brand", "Title", "Rank", "Starting Price", "Image", "Time"])
-        result_table.setRowCount(len(items))
-
-        for row, item in enumerate(items):
-            result_table.setItem(row, 0, QTableWidgetItem(item["Brand"]))
-            result_table.setItem(row, 1, QTableWidgetItem(item["Title"]))
-            result_table.setItem(row, 2, QTableWidgetItem(item["Rank"]))
-            result_table.setItem(row, 3, QTableWidgetItem(item["Starting Price"]))
-
-            if item["Image"]:
-                image_path = os.path.join(self.output_folder, 'images', item["Image"])
-                if os.path.exists(image_path):
-                    pixmap = QPixmap(image_path)
-                    pixmap = pixmap.scaled(QSize(100, 100), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    label = QLabel()
-                    label.setPixmap(pixmap)
-                    result_table.setCellWidget(row, 4, label)
-                    result_table.setRowHeight(row, 100)
-                else:
-                    result_table.setItem(row, 4, QTableWidgetItem(item["Image"]))
-            else:
-                result_table.setItem(row, 4, QTableWidgetItem("No Image"))
-
-            result_table.setItem(row, 5, QTableWidgetItem(item["Time"]))
+    def job_cancelled(self):
+        self.run_button.setEnabled(True)
+        self.pause_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        self.progress_label.setText(f"취소됨: 받은 항목 {len(self.result_lots)}건 (이어하기로 다시 시작 가능)")
+
+    def update_progress(self, brand, current_page, total_pages, items_found, item_index, metrics):
+        stages = metrics.get("stages", {})
+        timings = ", ".join(f"{name} {stat['avg']:.2f}초" for name, stat in stages.items() if name in ("page_fetch", "parse", "translate"))
+        self.progress_label.setText(f"브랜드: {brand}, 페이지: {current_page}/{total_pages}, 아이템: {items_found}, 페이지 내 항목: {item_index}" + (f" | 평균 {timings}" if timings else ""))
+        self.progress_bar.setValue(int(current_page / total_pages * 100))
 
+    def create_result_table(self):
+        result_table = QTableWidget()
+        result_table.setColumnCount(7)
+        result_table.setHorizontalHeaderLabels(["Brand", "Title", "Rank", "Starting Price", "Image", "Time", "Relist Of"])
         # 열 너비 조정
         result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        return result_table
+
+    def append_items(self, lots):
+        # 크롤링 중 페이지 단위로 받은 항목을 표 끝에 붙임 (이미지는 크롤링 후 따로 불러옴)
+        table = self.result_table
+        start = table.rowCount()
+        table.setUpdatesEnabled(False)
+        table.setRowCount(start + len(lots))
+        for row, lot in enumerate(lots, start):
+            for column, value in enumerate((lot.brand, lot.title, lot.rank, lot.starting_price, "", lot.time)):
+                table.setItem(row, column, QTableWidgetItem(value or ""))
+        table.setUpdatesEnabled(True)
+        self.result_lots.extend(lots)
 
-        self.result_tabs.addTab(result_table, "크롤링 결과")
+    def crawling_finished(self, items):
+        self.progress_bar.setValue(100)
+        self.progress_label.setText(f"크롤링 완료: {len(items)}건")
 
-        # 크롤링 완료 함수 호출
-        crawling_finished(items)
+        # 결과를 표로 표시 (크롤링 중 받지 못한 항목이 있으면 마저 붙임)
+        if len(self.result_lots) < len(items):
+            self.append_items(items[len(self.result_lots):])
 
-        QMessageBox.information(self, "완료", f"크롤링이 완료되었고, 결과가 스프레드시트에 저장되었습니다.\n{spreadsheet_url}")
+        image_rows = []
+        for row, lot in enumerate(self.result_lots):
+            if lot.image:
+                image_rows.append((row, image_display_path(self.output_folder, lot.image)))
+            else:
+                self.result_table.setItem(row, 4, QTableWidgetItem("No Image"))
+            # 재출품 여부는 이미지 해시를 비교한 뒤에야 알 수 있음
+            if lot.relist_of:
+                self.result_table.setItem(row, 6, QTableWidgetItem(lot.relist_of))
+
+        self.image_status = f"이미지 0/{len(image_rows)}"
+        self.image_loader = ImageLoader(image_rows)
+        # 이 표와 목록에 묶어 둠 (다음 크롤링이 self.result_table을 바꿔도 섞이지 않음)
+        self.image_loader.images_loaded.connect(functools.partial(self.show_images, self.result_table, self.result_lots))
+        self.image_loader.progress.connect(self.image_progress)
+        self.image_loader.start()
+
+        self.export_status = "내보내기 대기 중"
+        self.export_thread = ExportThread(items, self.output_folder, self.job, self.excel_profile_combo.currentData(),
+                                          self.image_archive_checkbox.isChecked())
+        self.export_thread.progress.connect(self.export_progress)
+        self.export_thread.finished.connect(self.export_finished)
+        self.export_thread.failed.connect(self.export_failed)
+        self.export_thread.cancelled.connect(self.job_cancelled)
+        self.export_thread.start()
+        self.show_status()
+
+    def stop_image_loader(self):
+        if not self.image_loader:
+            return
+        self.image_loader.requestInterruption()
+        for signal in (self.image_loader.images_loaded, self.image_loader.progress):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+        # 지금 읽는 이미지 하나만 마치고 끝나므로 오래 걸리지 않음
+        self.image_loader.wait()
+        self.image_loader = None
+
+    def show_images(self, table, lots, batch):
+        for row, image in batch:
+            if image is None:
+                table.setItem(row, 4, QTableWidgetItem(lots[row].image))
+                continue
+            label = QLabel()
+            label.setPixmap(QPixmap.fromImage(image))
+            table.setCellWidget(row, 4, label)
+            table.setRowHeight(row, GUI_THUMBNAIL_SIZE)
+
+    def image_progress(self, done, total):
+        self.image_status = f"이미지 {done}/{total}"
+        self.show_status()
+
+    def export_progress(self, stage, done, total):
+        self.export_status = f"{stage} {done}/{total}"
+        if total:
+            self.progress_bar.setValue(int(done / total * 100))
+        self.show_status()
+
+    def show_status(self):
+        self.progress_label.setText(f"크롤링 완료: {len(self.result_lots)}건 | {self.image_status} | 내보내기: {self.export_status}")
+
+    def export_finished(self, excel_path, spreadsheet_url):
+        self.run_button.setEnabled(True)
+        self.pause_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        self.export_status = "완료"
+        self.show_status()
+        QMessageBox.information(self, "완료", f"크롤링이 완료되었고, 결과가 스프레드시트에 저장되었습니다.\n{spreadsheet_url}\n엑셀: {excel_path}")
+
+    def export_failed(self, error):
+        self.run_button.setEnabled(True)
+        self.pause_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        self.export_status = "실패"
+        self.show_status()
+        QMessageBox.critical(self, "오류", f"결과 저장 중 오류가 발생했습니다: {error}")
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ("coordinator", "worker"):
+        sys.exit(main_distributed(sys.argv[1:]))
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
 
+    if METRICS_PORT:
+        start_metrics_server(METRICS_PORT)
+
     # 텔레그램 봇 실행
     bot_thread = threading.Thread(target=bot.polling, daemon=True)
     bot_thread.start()
 
+    # 인기 검색어 미리 크롤링
+    prefetch_scheduler = PrefetchScheduler(get_lot_store())
+    prefetch_scheduler.start()
+
+    # 구독 알림 (검색당 한 번 크롤링 후 변경분만 전송)
+    send_queue.start()
+    watch_service = WatchService(get_lot_store(), send_queue)
+    watch_service.start()
+
     sys.exit(app.exec_())
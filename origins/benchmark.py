@@ -0,0 +1,774 @@
+import sys
+import os
+import re
+import io
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+import tempfile
+import tracemalloc
+import resource
+import importlib.util
+import subprocess
+import http.server
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# 크롤러 파이프라인 벤치마크
+#   python benchmark.py generate --brands CHANEL HERMES --categories 2 --cards 1200
+#   python benchmark.py record --brands CHANEL --categories 2      (실제 사이트 응답 녹화)
+#   python benchmark.py run --latency 0.05 --error-rate 0.02 --output report.json
+#   python benchmark.py run --site penguin                          (사이트 어댑터별 측정)
+#   python benchmark.py memory --count 100000
+
+CRAWLER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "09230916.py")
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_fixtures")
+INSPECT_PATH = "/client/auctions/inspect"
+SYNTHETIC_HOST = "https://www.ecoauc.com"
+SYNTHETIC_IMAGE_HOST = "https://resize.ecoauc.com"
+PENGUIN_HOST = "https://penguin-auction.jp"
+PENGUIN_SEARCH_PATH = "/auction/"
+PENGUIN_PAGE_SIZE = 150
+
+def load_crawler():
+    spec = importlib.util.spec_from_file_location("crawler", CRAWLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def request_key(method, url):
+    # 호스트는 무시하고, 값이 빈 파라미터를 뺀 정렬된 쿼리로 요청을 식별
+    parsed = urllib.parse.urlparse(url)
+    query = sorted((k, v) for k, v in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True) if v != "")
+    key = f"{method.upper()} {parsed.path}"
+    if query:
+        key += "?" + urllib.parse.urlencode(query)
+    return key
+
+def percentiles(values):
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def pick(fraction):
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return round(ordered[index] * 1000, 3)
+
+    return {"p50": pick(0.5), "p95": pick(0.95), "p99": pick(0.99), "max": round(ordered[-1] * 1000, 3)}
+
+# ---------------------------------------------------------------------------
+# 픽스처 저장/불러오기
+
+class FixtureStore:
+    def __init__(self, fixture_dir):
+        self.fixture_dir = fixture_dir
+        self.manifest_path = os.path.join(fixture_dir, "manifest.json")
+        self.manifest = {"hosts": [], "brands": [], "categories": [], "responses": {}, "catalog": None}
+
+    def load(self):
+        with open(self.manifest_path, encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        return self
+
+    def save(self):
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+
+    def add_response(self, method, url, status, headers, body):
+        key = request_key(method, url)
+        file_name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".bin"
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(os.path.join(self.fixture_dir, file_name), "wb") as f:
+            f.write(body)
+        self.manifest["responses"][key] = {
+            "status": status,
+            "headers": {name: value for name, value in headers.items() if name in ("Content-Type", "Location", "Retry-After")},
+            "file": file_name
+        }
+
+    def add_host(self, url):
+        parsed = urllib.parse.urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+        if host not in self.manifest["hosts"]:
+            self.manifest["hosts"].append(host)
+
+    def read_body(self, entry):
+        with open(os.path.join(self.fixture_dir, entry["file"]), "rb") as f:
+            return f.read()
+
+def record_fixtures(args):
+    # 실제 사이트에서 로그인/검색/페이지/이미지 응답을 녹화
+    crawler = load_crawler()
+    store = FixtureStore(args.fixtures)
+    store.manifest["brands"] = args.brands
+    store.manifest["categories"] = args.categories
+    original_fetch = crawler.fetch
+
+    def recording_fetch(session, url, endpoint, method="GET", **kwargs):
+        response = original_fetch(session, url, endpoint, method=method, **kwargs)
+        full_url = requests.Request(method, url, params=kwargs.get("params")).prepare().url
+        store.add_host(full_url)
+        store.add_response(method, full_url, response.status_code, response.headers, response.content)
+        return response
+
+    crawler.fetch = recording_fetch
+    adapter = crawler.SITE_ADAPTERS[args.site]
+    session = adapter.login()
+    if not session:
+        print("로그인에 실패하여 녹화를 중단합니다.")
+        return 1
+
+    with tempfile.TemporaryDirectory() as output_folder:
+        # 캐시된 브랜드 ID를 쓰면 목록 요청이 녹화되지 않아 재생할 때 검색 URL이 달라짐
+        crawler.BRAND_IDS_PATH = os.path.join(output_folder, "brand_ids.json")
+        items = crawler.search_and_crawl(session, args.brands, args.categories, output_folder, None, adapter=adapter)
+
+    store.save()
+    print(f"녹화 완료: 응답 {len(store.manifest['responses'])}개, 아이템 {len(items)}개 → {args.fixtures}")
+    return 0
+
+def make_image(seed):
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return b""
+    from PIL import ImageDraw
+    rng = random.Random(seed)
+    image = PILImage.new("RGB", (220, 160), (rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+    # 사진마다 다른 무늬가 있어야 지각 해시로 서로 구분됨
+    draw = ImageDraw.Draw(image)
+    for _ in range(6):
+        x, y = rng.randrange(200), rng.randrange(140)
+        draw.rectangle((x, y, x + rng.randrange(20, 120), y + rng.randrange(20, 100)),
+                       fill=(rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=70)
+    return buffer.getvalue()
+
+def generate_fixtures(args):
+    # 실제 사이트 없이 돌릴 수 있는 합성 픽스처
+    store = FixtureStore(args.fixtures)
+    rng = random.Random(args.seed)
+    store.manifest["hosts"] = [SYNTHETIC_HOST, SYNTHETIC_IMAGE_HOST, PENGUIN_HOST]
+    store.manifest["brands"] = args.brands
+    store.manifest["categories"] = args.categories
+
+    html = {"Content-Type": "text/html; charset=UTF-8"}
+    store.add_response("GET", f"{SYNTHETIC_HOST}/client/users/sign-in", 200, html,
+                       b'<form><input type="hidden" name="_csrfToken" value="bench-token"></form>')
+    store.add_response("POST", f"{SYNTHETIC_HOST}/client/users/post-sign-in", 302,
+                       {"Location": f"{SYNTHETIC_HOST}/client"}, b"")
+    store.add_response("GET", f"{SYNTHETIC_HOST}/client", 200, html, b"<html>home</html>")
+    store.add_response("GET", f"{SYNTHETIC_HOST}/client/users", 200, html,
+                       "<html><h1>アカウント</h1><a href='/client/users/sign-out'>ログアウト</a></html>".encode("utf-8"))
+    # 펭귄옥션: 로그인 후 경매 목록으로 이동 (목록은 카탈로그로 그림)
+    store.add_response("POST", f"{PENGUIN_HOST}/login/", 302, {"Location": f"{PENGUIN_HOST}{PENGUIN_SEARCH_PATH}"}, b"")
+
+    catalog = []
+    brand_pool = args.brands + [f"OTHER BRAND {i}" for i in range(args.other_brands)]
+    store.manifest["brand_ids"] = {brand: str(1000 + i) for i, brand in enumerate(brand_pool)}
+    image_pool = [make_image(seed) for seed in range(args.distinct_images)]
+    for index in range(args.cards):
+        lot_id = str(300000000 + index)
+        image_path = f"/images/item/20261020/{lot_id}-1-bench.jpg"
+        catalog.append({
+            "id": lot_id,
+            "brand": rng.choice(brand_pool),
+            "category": rng.choice(args.categories),
+            "title": f"ショルダーバッグ {index}",
+            "rank": rng.choice(["S", "A", "AB", "B", "BC"]),
+            "price": f"{rng.randrange(1, 500) * 1000:,}",
+            "image": f"{SYNTHETIC_IMAGE_HOST}{image_path}?w=220&h=160",
+            "market_title": "2026年10月28日(水) 10:00～ エコオク"
+        })
+        store.add_response("GET", f"{SYNTHETIC_IMAGE_HOST}{image_path}", 200, {"Content-Type": "image/jpeg"},
+                           image_pool[index % len(image_pool)])
+    store.manifest["catalog"] = catalog
+    store.save()
+    print(f"합성 픽스처 생성: 경매품 {len(catalog)}개 → {args.fixtures}")
+    return 0
+
+# ---------------------------------------------------------------------------
+# 로컬 HTTP 스텁 (지연/오류 주입)
+
+CARD_TEMPLATE = """<div class="col-sm-6 col-md-4 col-lg-3 mb-grid-card"><div class="card" data-auction-item-id="{id}">
+<div class="item-image item-image-min pc-image-area"><img src="{image}"></div>
+<small class="show-case-bland">{brand}</small><b>{title}</b>
+<ul class="canopy canopy-3 text-default"><li><big class="canopy-value">ランク</big> {rank}</li><li><big class="canopy-value">{price}</big></li></ul>
+<span class="market-title">{market_title}</span></div></div>"""
+
+def render_inspect(catalog, brand_ids, query):
+    params = dict(urllib.parse.parse_qsl(query, keep_blank_values=True))
+    categories = {v for k, v in params.items() if k.startswith("master_item_categories") and v}
+    brand_names = {name for name, brand_id in brand_ids.items()
+                   if brand_id in {v for k, v in params.items() if k.startswith("master_item_brands") and v}}
+    text = params.get("q", "")
+    limit = int(params.get("limit") or 50)
+    page = int(params.get("page") or 1)
+
+    matched = [lot for lot in catalog
+               if (not categories or lot["category"] in categories)
+               and (not brand_names or lot["brand"] in brand_names)
+               and (not text or text in lot["brand"] or text in lot["title"])]
+    total_pages = (len(matched) + limit - 1) // limit
+    cards = matched[(page - 1) * limit:page * limit]
+
+    pagination = "".join(f"<li><a href='?page={i}'>{i}</a></li>" for i in range(1, total_pages + 1))
+    options = "".join(f"<option value='{brand_id}'>{name}</option>" for name, brand_id in brand_ids.items())
+    body = (f"<html><select name='master_item_brands[]' multiple>{options}</select><ul class='pagination'>{pagination}</ul>"
+            + "".join(CARD_TEMPLATE.format(**lot) for lot in cards) + "</html>")
+    return body.encode("utf-8")
+
+PENGUIN_CARD_TEMPLATE = """<li><div class="goods-img"><span class="rank">{rank}</span><img src="{image}"></div>
+<p class="goods-ttl"><a href="/product/detail/{id}/">{brand} {title}</a></p>
+<div class="currency-tbl"><div class="tr"><div class="td">Start</div><div class="td">Current</div></div>
+<div class="tr"><div class="td" data-stt-ignore>{price}</div></div><div class="tr"><div class="td" data-stt-ignore></div></div></div>
+<div class="countdown-time"><span class="text">Ends 10/28 10:00</span></div></li>"""
+
+def render_penguin(catalog, category_map, query):
+    # category_map: 펭귄옥션 카테고리 ID → 카탈로그(에코옥션) 카테고리 ID
+    params = dict(urllib.parse.parse_qsl(query, keep_blank_values=True))
+    category = category_map.get(params.get("category"))
+    word = params.get("word", "")
+    page = int(params.get("page") or 1)
+
+    matched = [lot for lot in catalog
+               if (not params.get("category") or lot["category"] == category)
+               and (not word or word in f"{lot['brand']} {lot['title']}")]
+    total_pages = (len(matched) + PENGUIN_PAGE_SIZE - 1) // PENGUIN_PAGE_SIZE
+    cards = matched[(page - 1) * PENGUIN_PAGE_SIZE:page * PENGUIN_PAGE_SIZE]
+
+    pager = "".join(f"<li><a href='?word={urllib.parse.quote(word)}&page={i}'>{i}</a></li>" for i in range(1, total_pages + 1))
+    body = (f"<html><div class='pager-block'><ul class='pager'>{pager}</ul></div><ul class='goods'>"
+            + "".join(PENGUIN_CARD_TEMPLATE.format(**lot) for lot in cards) + "</ul></html>")
+    return body.encode("utf-8")
+
+class FixtureServer:
+    def __init__(self, fixture_dir, latency=0.0, jitter=0.5, error_rate=0.0, seed=0, penguin_categories=None):
+        self.store = FixtureStore(fixture_dir).load()
+        self.penguin_categories = penguin_categories or {}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "errors_injected": 0, "not_found": 0, "bytes_sent": 0}
+        self.server = None
+        self.base_url = None
+
+    def start(self):
+        fixture = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                fixture.handle(self, "GET")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                fixture.handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def rewrite(self, body):
+        for host in self.store.manifest["hosts"]:
+            body = body.replace(host.encode("utf-8"), self.base_url.encode("utf-8"))
+        return body
+
+    def handle(self, handler, method):
+        with self.lock:
+            self.stats["requests"] += 1
+            delay = self.rng.uniform(self.latency * (1 - self.jitter), self.latency * (1 + self.jitter)) if self.latency else 0
+            inject_error = self.rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if inject_error:
+            with self.lock:
+                self.stats["errors_injected"] += 1
+            self.send(handler, 503, {"Content-Type": "text/plain"}, b"injected error")
+            return
+
+        key = request_key(method, handler.path)
+        entry = self.store.manifest["responses"].get(key)
+        if not entry and method == "GET" and "?" in handler.path:
+            # 썸네일 크기 파라미터(w, h)가 붙은 이미지 요청은 원본 응답으로 대신함
+            entry = self.store.manifest["responses"].get(request_key(method, handler.path.split("?", 1)[0]))
+        if entry:
+            headers = dict(entry["headers"])
+            if "Location" in headers:
+                headers["Location"] = self.rewrite(headers["Location"].encode("utf-8")).decode("utf-8")
+            body = self.store.read_body(entry)
+            if headers.get("Content-Type", "").startswith("text/"):
+                body = self.rewrite(body)
+            self.send(handler, entry["status"], headers, body)
+            return
+
+        parsed = urllib.parse.urlparse(handler.path)
+        if self.store.manifest.get("catalog") and parsed.path == INSPECT_PATH:
+            body = self.rewrite(render_inspect(self.store.manifest["catalog"], self.store.manifest.get("brand_ids", {}), parsed.query))
+            self.send(handler, 200, {"Content-Type": "text/html; charset=UTF-8"}, body)
+            return
+        if self.store.manifest.get("catalog") and parsed.path == PENGUIN_SEARCH_PATH:
+            body = self.rewrite(render_penguin(self.store.manifest["catalog"], self.penguin_categories, parsed.query))
+            self.send(handler, 200, {"Content-Type": "text/html; charset=UTF-8"}, body)
+            return
+
+        with self.lock:
+            self.stats["not_found"] += 1
+        # 녹화되지 않은 검색 페이지는 빈 결과로 응답
+        self.send(handler, 200 if parsed.path == INSPECT_PATH else 404, {"Content-Type": "text/html"}, b"<html></html>")
+
+    def send(self, handler, status, headers, body):
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+        with self.lock:
+            self.stats["bytes_sent"] += len(body)
+
+# ---------------------------------------------------------------------------
+# 가짜 Google Sheets API
+
+class FakeSheetsAPI:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = []
+        self.lock = threading.Lock()
+        self.spreadsheets = {}
+
+    def call(self, name):
+        start = time.perf_counter()
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.calls.append((name, time.perf_counter() - start))
+
+class FakeWorksheet:
+    def __init__(self, api, title, sheet_id=0):
+        self.api = api
+        self.title = title
+        self.id = sheet_id
+        self.rows = []
+
+    def append_row(self, row, **kwargs):
+        self.api.call("append_row")
+        self.rows.append([str(v) if v is not None else "" for v in row])
+
+    def append_rows(self, rows, **kwargs):
+        self.api.call("append_rows")
+        self.rows.extend([str(v) if v is not None else "" for v in row] for row in rows)
+
+    def get_all_values(self, **kwargs):
+        self.api.call("get_all_values")
+        return [list(row) for row in self.rows]
+
+    def get_values(self, range_name=None, **kwargs):
+        self.api.call("get_values")
+        if not range_name:
+            return [list(row) for row in self.rows]
+        match = re.match(r"([A-Z]+)(\d*):([A-Z]+)(\d*)", range_name)
+        first_col = column_index(match.group(1))
+        last_col = column_index(match.group(3))
+        first_row = int(match.group(2) or 1) - 1
+        last_row = int(match.group(4)) if match.group(4) else len(self.rows)
+        return [row[first_col:last_col + 1] for row in self.rows[first_row:last_row]]
+
+def column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index - 1
+
+def cell_text(cell):
+    # 시트 API가 돌려주는 표시값처럼 문자열로 바꿈
+    value = next(iter(cell["userEnteredValue"].values()))
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    return str(value)
+
+class FakeSpreadsheet:
+    def __init__(self, api, title):
+        self.api = api
+        self.title = title
+        self.id = hashlib.sha1(f"{title}{time.time()}{random.random()}".encode("utf-8")).hexdigest()[:20]
+        self.url = f"https://docs.google.com/spreadsheets/d/{self.id}"
+        self.worksheets = [FakeWorksheet(api, "Sheet1")]
+        self.batch_requests = []
+
+    def get_worksheet(self, index):
+        self.api.call("get_worksheet")
+        return self.worksheets[index]
+
+    def worksheet(self, title):
+        self.api.call("worksheet")
+        for sheet in self.worksheets:
+            if sheet.title == title:
+                return sheet
+        raise KeyError(title)
+
+    def add_worksheet(self, title, rows=None, cols=None, **kwargs):
+        self.api.call("add_worksheet")
+        sheet = FakeWorksheet(self.api, title, len(self.worksheets))
+        self.worksheets.append(sheet)
+        return sheet
+
+    def batch_update(self, body):
+        self.api.call("batch_update")
+        for request in body.get("requests", []):
+            self.batch_requests.append(request)
+            self.apply(request)
+        return {"replies": [{} for _ in body.get("requests", [])]}
+
+    def sheet_by_id(self, sheet_id):
+        return next(sheet for sheet in self.worksheets if sheet.id == sheet_id)
+
+    def apply(self, request):
+        # 행 삭제/값 쓰기/행 추가만 시트 내용에 반영 (서식 요청은 기록만)
+        if "deleteDimension" in request:
+            target = request["deleteDimension"]["range"]
+            del self.sheet_by_id(target["sheetId"]).rows[target["startIndex"]:target["endIndex"]]
+        elif "updateCells" in request:
+            target = request["updateCells"]["start"]
+            rows = self.sheet_by_id(target["sheetId"]).rows
+            for offset, row in enumerate(request["updateCells"]["rows"]):
+                current = rows[target["rowIndex"] + offset]
+                values = [cell_text(cell) for cell in row["values"]]
+                current.extend([""] * (target["columnIndex"] + len(values) - len(current)))
+                current[target["columnIndex"]:target["columnIndex"] + len(values)] = values
+        elif "appendCells" in request:
+            target = request["appendCells"]
+            self.sheet_by_id(target["sheetId"]).rows.extend(
+                [cell_text(cell) for cell in row["values"]] for row in target["rows"])
+
+    def share(self, value, perm_type=None, role=None, **kwargs):
+        self.api.call("share")
+
+class FakeSheetsClient:
+    def __init__(self, api):
+        self.api = api
+
+    def create(self, title, **kwargs):
+        self.api.call("create")
+        spreadsheet = FakeSpreadsheet(self.api, title)
+        self.api.spreadsheets[spreadsheet.id] = spreadsheet
+        return spreadsheet
+
+    def open_by_key(self, key):
+        self.api.call("open_by_key")
+        return self.api.spreadsheets[key]
+
+    def open_by_url(self, url):
+        return self.open_by_key(url.rstrip("/").split("/")[-1])
+
+class FakeTranslator:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+
+    def translate(self, text, src=None, dest=None):
+        if self.latency:
+            time.sleep(self.latency)
+        return type("Translated", (), {"text": text})()
+
+# ---------------------------------------------------------------------------
+# 벤치마크 실행
+
+class StageRunner:
+    def __init__(self):
+        self.report = {}
+
+    def run(self, name, func, units_of=None, unit="items", latencies=None):
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+
+        units = units_of(result) if units_of else 1
+        if callable(latencies):
+            latencies = latencies()
+        self.report[name] = {
+            "seconds": round(seconds, 4),
+            "units": units,
+            "unit": unit,
+            "throughput_per_sec": round(units / seconds, 2) if seconds > 0 else None,
+            "latency_ms": percentiles(latencies if latencies is not None else [seconds]),
+            "peak_memory_bytes": peak
+        }
+        print(f"[{name}] {seconds:.3f}초, {units} {unit}, 최대 메모리 {peak / 1024 / 1024:.1f}MB")
+        return result
+
+def timed_calls(func, latencies):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+    return wrapper
+
+def changed_lots(crawler, items, seed, fraction=0.1):
+    # 갱신 시나리오: 약 10%는 낙찰되어 빠지고, 10%는 가격이 바뀌고, 10%는 새로 들어옴
+    rng = random.Random(seed)
+    count = max(1, int(len(items) * fraction))
+    kept = [lot for lot in items if rng.random() > fraction]
+    for lot in rng.sample(kept, min(count, len(kept))):
+        lot.starting_price = f"{(lot.price or 0) + 1000:,}円"
+    new_lots = [crawler.Lot(f"bench-new-{index}", lot.brand, lot.category, lot.title, lot.rank, lot.starting_price,
+                            lot.image_url, lot.image, lot.time, lot.date)
+                for index, lot in enumerate(rng.sample(items, min(count, len(items))))]
+    return kept + new_lots
+
+def run_benchmark(args):
+    crawler = load_crawler()
+    adapter = crawler.SITE_ADAPTERS[args.site]
+    penguin_categories = {site_id: category for category, site_id in crawler.PENGUIN_CATEGORY_IDS.items()}
+    fixture = FixtureServer(args.fixtures, args.latency, args.jitter, args.error_rate, args.seed, penguin_categories).start()
+    manifest = fixture.store.manifest
+    brands = args.brands or manifest["brands"]
+    categories = args.categories or manifest["categories"]
+
+    work_dir = tempfile.mkdtemp(prefix="crawler-bench-")
+    crawler.ECOAUC_BASE_URL = fixture.base_url
+    crawler.PENGUIN_BASE_URL = fixture.base_url
+    crawler.PAGE_DELAY = 0
+    crawler.PENGUIN_PAGE_DELAY = 0
+    crawler.BRAND_IDS_PATH = os.path.join(work_dir, "brand_ids.json")
+    crawler.resilience = crawler.Resilience(backoff_base=args.backoff_base, backoff_max=1.0, reset_timeout=1.0)
+    crawler.crawl_metrics.log_path = os.path.join(work_dir, "crawl_metrics.jsonl")
+    crawler.translation_engine = crawler.TranslationEngine(os.path.join(work_dir, "translation_glossary.json"),
+                                                           os.path.join(work_dir, "translation_cache.json"))
+    sheets_api = FakeSheetsAPI(args.sheets_latency)
+    crawler.get_sheets_client = lambda: FakeSheetsClient(sheets_api)
+    translator = FakeTranslator(args.translate_latency) if args.translate_latency else None
+
+    # 엔드포인트별 요청 지연 수집
+    fetch_latencies = {"login": [], "inspect": [], "image": []}
+    original_fetch = crawler.fetch
+
+    def measured_fetch(session, url, endpoint, method="GET", **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_fetch(session, url, endpoint, method=method, **kwargs)
+        finally:
+            fetch_latencies.setdefault(endpoint, []).append(time.perf_counter() - start)
+
+    crawler.fetch = measured_fetch
+    runner = StageRunner()
+    tracemalloc.start()
+
+    login_latencies = []
+    login = timed_calls(adapter.login, login_latencies)
+    session = runner.run("login_and_check", lambda: [login() for _ in range(args.login_runs)][-1],
+                         units_of=lambda _: args.login_runs, unit="logins", latencies=login_latencies)
+    if not session:
+        print("스텁 로그인 실패")
+        fixture.stop()
+        return 1
+
+    crawl_dir = os.path.join(work_dir, "crawl")
+    items = runner.run("search_and_crawl",
+                       lambda: crawler.search_and_crawl(session, brands, categories, crawl_dir, translator, adapter=adapter),
+                       units_of=len, unit="items", latencies=fetch_latencies["inspect"])
+    runner.report["search_and_crawl"]["pages"] = len(fetch_latencies["inspect"])
+
+    image_urls = [lot.image_url for lot in items if lot.image_url]
+    image_dir = os.path.join(work_dir, "images-bench")
+    image_latencies = []
+    download = timed_calls(crawler.download_image, image_latencies)
+
+    def download_all():
+        with ThreadPoolExecutor() as executor:
+            return [path for path in executor.map(lambda url: download(url, image_dir, None, adapter), image_urls) if path]
+
+    runner.run("download_image", download_all, units_of=len, unit="images", latencies=image_latencies)
+    runner.report["download_image"]["bytes"] = sum(os.path.getsize(os.path.join(image_dir, f)) for f in os.listdir(image_dir)) if os.path.isdir(image_dir) else 0
+
+    # 저장 방식별 엑셀 저장 (full은 기존 보고서와 같은 이름 유지)
+    for profile in crawler.EXCEL_PROFILES:
+        name = "save_to_excel" if profile == "full" else f"save_to_excel_{profile}"
+        runner.run(name, lambda: crawler.save_to_excel(items, crawl_dir, profile=profile),
+                   units_of=lambda _: len(items), unit="rows")
+
+    sheets_api.calls.clear()
+    runner.run("save_to_spreadsheet", lambda: crawler.save_to_spreadsheet(items),
+               units_of=lambda _: len(items), unit="rows", latencies=lambda: [seconds for _, seconds in sheets_api.calls])
+    runner.report["save_to_spreadsheet"]["api_calls"] = len(sheets_api.calls)
+
+    # 검색별 스프레드시트 재사용: 첫 생성 후 일부 경매품이 바뀐 목록으로 갱신
+    lot_store = crawler.LotStore(os.path.join(work_dir, "lots.db"))
+    registry_key = (brands[0], categories[0])
+    crawler.save_to_spreadsheet(items, *registry_key, lot_store=lot_store)
+    refreshed = changed_lots(crawler, items, args.seed)
+    sheets_api.calls.clear()
+    runner.run("refresh_spreadsheet", lambda: crawler.save_to_spreadsheet(refreshed, *registry_key, lot_store=lot_store),
+               units_of=lambda _: len(refreshed), unit="rows", latencies=lambda: [seconds for _, seconds in sheets_api.calls])
+    runner.report["refresh_spreadsheet"]["api_calls"] = len(sheets_api.calls)
+    lot_store.close()
+
+    tracemalloc.stop()
+    fixture.stop()
+
+    report = {
+        "config": {
+            "site": args.site,
+            "fixtures": args.fixtures,
+            "brands": brands,
+            "categories": categories,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "sheets_latency": args.sheets_latency,
+            "translate_latency": args.translate_latency,
+            "seed": args.seed
+        },
+        "stages": runner.report,
+        "http": {endpoint: {"requests": len(values), "latency_ms": percentiles(values)} for endpoint, values in fetch_latencies.items()},
+        "stub": fixture.stats,
+        "crawl_metrics": crawler.crawl_metrics.snapshot(),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        print(f"결과 저장: {args.output}")
+    else:
+        print(output)
+    return 0
+
+# ---------------------------------------------------------------------------
+# 메모리 벤치마크: 경매품을 dict로 들고 있을 때와 Lot으로 들고 있을 때의 최대 RSS 비교
+
+def parsed_text(value):
+    # HTML 파싱 결과처럼 매번 새 문자열 객체를 만듦
+    return "".join(list(value))
+
+def build_records(variant, count, crawler=None):
+    rng = random.Random(0)
+    brands = ["CHANEL", "LOUIS VUITTON", "HERMES", "GUCCI", "PRADA", "ROLEX", "OMEGA", "Cartier"]
+    ranks = ["S", "A", "AB", "B", "BC", "C"]
+    records = []
+    for index in range(count):
+        fields = (
+            str(300000000 + index),
+            parsed_text(rng.choice(brands)),
+            parsed_text("2"),
+            f"ショルダーバッグ キャビアスキン ブラック {index}",
+            parsed_text(rng.choice(ranks)),
+            f"{rng.randrange(1, 500) * 1000:,}",
+            f"https://resize.ecoauc.com/images/item/20261020/{300000000 + index}-1-abcdefghij.jpg?w=220&h=160",
+            None,
+            parsed_text("2026年10月28日(水) 10:00～ エコオク"),
+            parsed_text("2026-10-28 10:00:00")
+        )
+        if variant == "dict":
+            records.append(dict(zip(("ID", "Brand", "Category", "Title", "Rank", "Starting Price",
+                                     "Image URL", "Image", "Time", "Date"), fields)))
+        else:
+            records.append(crawler.Lot(*fields))
+    return records
+
+def memory_worker(args):
+    crawler = load_crawler() if args.variant == "lot" else None
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    records = build_records(args.variant, args.count, crawler)
+    seconds = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"variant": args.variant, "count": len(records), "build_seconds": round(seconds, 3),
+                      "rss_before_kb": before, "peak_rss_kb": after, "records_rss_kb": after - before}))
+    return 0
+
+def memory_benchmark(args):
+    results = {}
+    for variant in ("dict", "lot"):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "memory-worker", "--variant", variant,
+                                 "--count", str(args.count)], capture_output=True, text=True, check=True).stdout
+        results[variant] = json.loads(output.strip().splitlines()[-1])
+
+    report = {
+        "count": args.count,
+        "dict": results["dict"],
+        "lot": results["lot"],
+        "records_rss_ratio": round(results["lot"]["records_rss_kb"] / results["dict"]["records_rss_kb"], 3)
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="크롤러 파이프라인 벤치마크")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURE_DIR)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record = subparsers.add_parser("record", help="실제 사이트 응답을 픽스처로 녹화")
+    record.add_argument("--brands", nargs="+", required=True)
+    record.add_argument("--categories", nargs="+", required=True)
+    record.add_argument("--site", default="ecoauc")
+
+    generate = subparsers.add_parser("generate", help="합성 픽스처 생성")
+    generate.add_argument("--brands", nargs="+", default=["CHANEL", "LOUIS VUITTON", "HERMES"])
+    generate.add_argument("--categories", nargs="+", default=["2"])
+    generate.add_argument("--cards", type=int, default=1500)
+    generate.add_argument("--distinct-images", type=int, default=50)
+    generate.add_argument("--other-brands", type=int, default=20, help="검색하지 않는 브랜드 수 (텍스트 검색에서 버려지는 카드)")
+    generate.add_argument("--seed", type=int, default=0)
+
+    run = subparsers.add_parser("run", help="스텁 서버로 파이프라인 실행")
+    run.add_argument("--site", default="ecoauc", help="측정할 사이트 어댑터 (ecoauc, penguin)")
+    run.add_argument("--brands", nargs="+")
+    run.add_argument("--categories", nargs="+")
+    run.add_argument("--latency", type=float, default=0.0, help="요청당 평균 지연 (초)")
+    run.add_argument("--jitter", type=float, default=0.5, help="지연 변동 비율")
+    run.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율")
+    run.add_argument("--sheets-latency", type=float, default=0.0, help="가짜 Sheets API 호출당 지연 (초)")
+    run.add_argument("--translate-latency", type=float, default=0.0, help="0보다 크면 가짜 번역기 사용")
+    run.add_argument("--login-runs", type=int, default=3)
+    run.add_argument("--backoff-base", type=float, default=0.05)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--output")
+
+    memory = subparsers.add_parser("memory", help="dict와 Lot의 최대 RSS 비교")
+    memory.add_argument("--count", type=int, default=100000)
+
+    memory_worker_parser = subparsers.add_parser("memory-worker")
+    memory_worker_parser.add_argument("--variant", choices=["dict", "lot"], required=True)
+    memory_worker_parser.add_argument("--count", type=int, default=100000)
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        return record_fixtures(args)
+    if args.command == "generate":
+        return generate_fixtures(args)
+    if args.command == "memory":
+        return memory_benchmark(args)
+    if args.command == "memory-worker":
+        return memory_worker(args)
+    return run_benchmark(args)
+
+if __name__ == "__main__":
+    sys.exit(main())